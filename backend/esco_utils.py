@@ -1,29 +1,54 @@
+import os
+from functools import lru_cache
 import pandas as pd
 
-def load_esco_skills(file_path="skills_en.csv"):
+# Location of the bundled ESCO classification export
+ESCO_DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data",
+                             "ESCO dataset - v1.2.0 - classification - en - csv")
+ESCO_SKILLS_PATH = os.path.join(ESCO_DATA_DIR, "skills_en.csv")
+
+# The C engine, not pyarrow: nearly every ESCO row has quoted fields with
+# embedded newlines, which pyarrow's default CSV parse options reject
+CSV_ENGINE = "c"
+
+@lru_cache(maxsize=4)
+def load_esco_skills(file_path=ESCO_SKILLS_PATH):
     """
     Load the ESCO skills dataset and extract skill names.
+    
+    Results are cached per path, so repeated calls share one frozenset.
     """
-    # Load the CSV file
-    df = pd.read_csv('/home/abdullah/Desktop/resume-parser-job-matcher/backend/data/ESCO dataset - v1.2.0 - classification - en - csv')
+    # Load the CSV file, parsing only the label column
+    df = pd.read_csv(file_path, usecols=['preferredLabel'], engine=CSV_ENGINE)
     
     # Extract the 'preferredLabel' column (skill names)
-    skills = set(df['preferredLabel'].str.lower().dropna().unique())
+    skills = frozenset(df['preferredLabel'].str.lower().dropna().unique())
     
     return skills
 
+def get_esco_skills_set():
+    """
+    Return the shared ESCO skill set, loading it on first use.
+    
+    Pass this to extract_skills_from_text so every caller reuses one instance
+    (and one cached skill index).
+    """
+    return load_esco_skills(ESCO_SKILLS_PATH)
+
 def load_esco_skills_with_synonyms(file_path="skills.csv"):
     """
     Load the ESCO skills dataset with synonyms.
     """
-    # Load the CSV file
-    df = pd.read_csv(file_path)
+    # Load the CSV file, parsing only the label columns
+    df = pd.read_csv(file_path, usecols=['preferredLabel', 'altLabels'], engine=CSV_ENGINE)
     
-    # Create a mapping of preferred labels to alternative labels
-    skill_mapping = {}
-    for _, row in df.iterrows():
-        preferred_label = row['preferredLabel'].lower()
-        alt_labels = [label.lower() for label in row['altLabels'].split(';')] if pd.notna(row['altLabels']) else []
-        skill_mapping[preferred_label] = alt_labels
+    # Create a mapping of preferred labels to alternative labels using
+    # column-wise string operations instead of iterating rows
+    preferred_labels = df['preferredLabel'].str.lower()
+    alt_labels = df['altLabels'].str.lower().str.split(';')
+    skill_mapping = {
+        preferred_label: labels if isinstance(labels, list) else []
+        for preferred_label, labels in zip(preferred_labels, alt_labels)
+    }
     
     return skill_mapping
\ No newline at end of file
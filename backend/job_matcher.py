@@ -1,18 +1,24 @@
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
+from sklearn.feature_extraction.text import HashingVectorizer, TfidfTransformer
 from sklearn.decomposition import TruncatedSVD
 from sklearn.pipeline import Pipeline
+from scipy.sparse import issparse
 from nltk.corpus import stopwords
-from nltk.tokenize import word_tokenize
 from nltk.stem import WordNetLemmatizer, PorterStemmer
 import re
+import string
 import numpy as np
 import logging
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ProcessPoolExecutor
 import os
-import pickle
+import sys
+import time
+import hashlib
+import sqlite3
+import threading
+import multiprocessing
 import nltk
 from collections import Counter
+from functools import lru_cache
 
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -21,7 +27,7 @@ logger = logging.getLogger(__name__)
 # Initialize NLTK resources with error handling
 def initialize_nltk():
     """Initialize NLTK resources with proper error handling."""
-    nltk_resources = ["stopwords", "punkt", "wordnet", "averaged_perceptron_tagger"]
+    nltk_resources = ["stopwords", "wordnet", "averaged_perceptron_tagger"]
     
     for resource in nltk_resources:
         try:
@@ -53,6 +59,9 @@ JOB_STOP_WORDS = {
     "submit", "resume", "cv", "year", "day", "month", "week", "hour", "time"
 }
 
+# NLTK stopwords combined with domain-specific ones, built once
+ALL_STOP_WORDS = frozenset(stop_words) | frozenset(JOB_STOP_WORDS)
+
 # Domain keywords with higher importance
 DOMAIN_KEYWORDS = {
     "software": 1.5, "developer": 1.5, "engineer": 1.5, "programmer": 1.5,
@@ -65,33 +74,174 @@ DOMAIN_KEYWORDS = {
     "financial": 1.5, "healthcare": 1.5, "education": 1.5, "retail": 1.5
 }
 
-def get_vectorizer_cache_path():
-    """Return a path for caching the vectorizer model."""
+# Maximum number of distinct documents kept in the in-process preprocessing caches
+PREPROCESS_CACHE_SIZE = 50000
+
+# Stateless term hasher shared by all requests; TF-IDF weighting is applied per corpus
+HASHING_VECTORIZER = HashingVectorizer(
+    analyzer='word',
+    n_features=2 ** 18,
+    alternate_sign=False,  # Keep counts non-negative for TF-IDF
+    ngram_range=(1, 2),  # Include both unigrams and bigrams
+    norm=None,  # TfidfTransformer normalizes after weighting
+    dtype=np.float32  # Halves memory traffic into the cosine step
+)
+
+# Preprocessed text persisted on disk expires after a week
+PREPROCESS_DISK_CACHE_TTL = 7 * 24 * 3600
+# Rows kept after pruning; the oldest entries beyond this are deleted
+PREPROCESS_DISK_CACHE_MAX_ROWS = 100000
+
+# Per-thread SQLite connections for the on-disk preprocessing cache, tracked so
+# shutdown_preprocessing can close them
+_disk_cache_local = threading.local()
+_disk_cache_connections = set()
+
+# Entries waiting for the next batched write; only the parent process writes
+_disk_cache_pending = []
+_disk_cache_lock = threading.Lock()
+
+# Below this many documents, process startup and pickling cost more than parallelism saves
+PARALLEL_MIN_DOCUMENTS = 200
+
+# Created on first use (or by warm_up_preprocessing) so importing the module does not spawn workers
+_process_pool = None
+
+# URLs, email addresses and phone numbers, removed in a single regex pass
+_NOISE_RE = re.compile(
+    r'https?://\S+|www\.\S+'
+    r'|\S+@\S+'
+    r'|\b(?:\+\d{1,2}\s)?\(?\d{3}\)?[\s.-]?\d{3}[\s.-]?\d{4}\b'
+)
+
+# ASCII punctuation and non-whitespace control characters are dropped, as
+# [^\w\s-] did (underscore is a word char and kept); hyphens become spaces
+_ASCII_CONTROL = [chr(i) for i in (*range(32), 127) if not chr(i).isspace()]
+_PUNCT_TABLE = str.maketrans({
+    c: " " if c == "-" else None
+    for c in (*string.punctuation, *_ASCII_CONTROL) if c != "_"
+})
+_NON_WORD_RE = re.compile(r'[^\w\s]')
+
+# Treebank contractions word_tokenize splits; the other forms it handles all
+# need an apostrophe, which cleanup has already removed
+_TREEBANK_CONTRACTIONS = {
+    "cannot": ("can", "not"),
+    "gimme": ("gim", "me"),
+    "gonna": ("gon", "na"),
+    "gotta": ("got", "ta"),
+    "lemme": ("lem", "me"),
+    "wanna": ("wan", "na"),
+}
+
+def get_cache_dir():
+    """Return the directory used for on-disk job ranking caches."""
     cache_dir = os.path.join(os.path.expanduser("~"), ".job_ranking_cache")
     os.makedirs(cache_dir, exist_ok=True)
-    return os.path.join(cache_dir, "tfidf_vectorizer.pkl")
+    return cache_dir
 
-def save_vectorizer(vectorizer):
-    """Save the trained vectorizer for reuse."""
+def _get_disk_cache():
+    """
+    Return this thread's connection to the on-disk preprocessing cache.
+    
+    SQLite connections cannot be shared across threads or forked processes,
+    so one is opened per thread and reopened after a fork.
+    """
+    conn = getattr(_disk_cache_local, "conn", None)
+    if conn is None or _disk_cache_local.pid != os.getpid() or conn not in _disk_cache_connections:
+        # Each connection is only used by its own thread; the flag lets
+        # _close_disk_cache close all of them from the shutdown thread
+        conn = sqlite3.connect(
+            os.path.join(get_cache_dir(), "preprocessed_text.sqlite3"),
+            timeout=5,
+            check_same_thread=False
+        )
+        # Cache contents can always be recomputed, so favour write speed over durability
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=OFF")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS preprocessed "
+            "(key TEXT PRIMARY KEY, value TEXT NOT NULL, created REAL NOT NULL)"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS preprocessed_created ON preprocessed (created)")
+        _disk_cache_local.conn = conn
+        _disk_cache_local.pid = os.getpid()
+        with _disk_cache_lock:
+            _disk_cache_connections.add(conn)
+    return conn
+
+def _disk_cache_get(key):
+    """Look up preprocessed text on disk, returning None on a miss or expired entry."""
+    try:
+        row = _get_disk_cache().execute(
+            "SELECT value FROM preprocessed WHERE key = ? AND created > ?",
+            (key, time.time() - PREPROCESS_DISK_CACHE_TTL)
+        ).fetchone()
+        return row[0] if row else None
+    except Exception as e:
+        logger.warning(f"Failed to read preprocessing cache: {e}")
+        return None
+
+def _disk_cache_set(key, value):
+    """Queue preprocessed text for the next batched disk write."""
+    with _disk_cache_lock:
+        _disk_cache_pending.append((key, value, time.time()))
+
+def _take_pending_disk_writes():
+    """Remove and return the queued disk cache entries."""
+    global _disk_cache_pending
+    with _disk_cache_lock:
+        pending, _disk_cache_pending = _disk_cache_pending, []
+    return pending
+
+def _flush_disk_cache(entries=()):
+    """
+    Write queued (and any given) entries to the disk cache in one transaction.
+    
+    Args:
+        entries (list): Extra (key, value, created) rows, e.g. returned by pool workers
+    """
+    rows = _take_pending_disk_writes() + list(entries)
+    if not rows:
+        return
     try:
-        with open(get_vectorizer_cache_path(), 'wb') as f:
-            pickle.dump(vectorizer, f)
-        logger.info("TF-IDF vectorizer cached successfully")
+        conn = _get_disk_cache()
+        conn.executemany(
+            "INSERT OR REPLACE INTO preprocessed (key, value, created) VALUES (?, ?, ?)",
+            rows
+        )
+        conn.commit()
     except Exception as e:
-        logger.warning(f"Failed to cache vectorizer: {e}")
+        logger.warning(f"Failed to write preprocessing cache: {e}")
 
-def load_vectorizer():
-    """Load a previously trained vectorizer if available."""
+def _prune_disk_cache():
+    """Delete expired entries and the oldest ones beyond PREPROCESS_DISK_CACHE_MAX_ROWS."""
     try:
-        cache_path = get_vectorizer_cache_path()
-        if os.path.exists(cache_path):
-            with open(cache_path, 'rb') as f:
-                vectorizer = pickle.load(f)
-            logger.info("Loaded cached TF-IDF vectorizer")
-            return vectorizer
+        conn = _get_disk_cache()
+        conn.execute(
+            "DELETE FROM preprocessed WHERE created <= ?",
+            (time.time() - PREPROCESS_DISK_CACHE_TTL,)
+        )
+        conn.execute(
+            "DELETE FROM preprocessed WHERE key IN "
+            "(SELECT key FROM preprocessed ORDER BY created DESC LIMIT -1 OFFSET ?)",
+            (PREPROCESS_DISK_CACHE_MAX_ROWS,)
+        )
+        conn.commit()
     except Exception as e:
-        logger.warning(f"Failed to load cached vectorizer: {e}")
-    return None
+        logger.warning(f"Failed to prune preprocessing cache: {e}")
+
+def _close_disk_cache():
+    """Flush pending entries and close every disk cache connection opened by this process."""
+    _flush_disk_cache()
+    with _disk_cache_lock:
+        connections = list(_disk_cache_connections)
+        _disk_cache_connections.clear()
+    for conn in connections:
+        try:
+            conn.close()
+        except Exception as e:
+            logger.warning(f"Failed to close preprocessing cache: {e}")
 
 def preprocess_text(text, use_stemming=False):
     """
@@ -106,53 +256,56 @@ def preprocess_text(text, use_stemming=False):
     """
     if not text or not isinstance(text, str):
         return ""
-
-    # Convert to lowercase
-    text = text.lower()
-    
-    # Remove URLs
-    text = re.sub(r'https?://\S+|www\.\S+', '', text)
-    
-    # Remove email addresses
-    text = re.sub(r'\S+@\S+', '', text)
-    
-    # Remove phone numbers
-    text = re.sub(r'\b(?:\+\d{1,2}\s)?\(?\d{3}\)?[\s.-]?\d{3}[\s.-]?\d{4}\b', '', text)
-    
-    # Remove special characters but keep hyphens for compound words
-    text = re.sub(r'[^\w\s-]', '', text)
-    
-    # Replace hyphens with spaces to split compound words
-    text = re.sub(r'-', ' ', text)
-    
-    # Tokenize text
-    try:
-        words = word_tokenize(text)
-    except:
-        # Fallback to simple splitting if tokenization fails
-        words = text.split()
     
-    # Combine NLTK stopwords with domain-specific ones
-    all_stop_words = stop_words.union(JOB_STOP_WORDS)
+    return _preprocess_text(text, use_stemming)
+
+# Job boards return the same descriptions across skill queries and requests,
+# so preprocessing results are memoized on the raw string
+@lru_cache(maxsize=PREPROCESS_CACHE_SIZE)
+def _preprocess_text(text, use_stemming):
+    """Cached implementation of preprocess_text for non-empty strings."""
+    # Convert to lowercase and remove URLs, email addresses and phone numbers in one pass
+    text = _NOISE_RE.sub('', text.lower())
+    
+    # Remove special characters but keep hyphens for compound words, then
+    # replace hyphens with spaces to split compound words
+    text = text.translate(_PUNCT_TABLE)
+    if not text.isascii():
+        # Non-ASCII symbols are not covered by the translation table
+        text = _NON_WORD_RE.sub('', text)
+    
+    # Tokenize text. After cleanup only word characters and whitespace remain,
+    # so whitespace splitting plus the Treebank contraction splits yields the
+    # same tokens as word_tokenize without running the Punkt/Treebank machinery
+    words = text.split()
+    if not _TREEBANK_CONTRACTIONS.keys().isdisjoint(words):
+        words = [part for word in words for part in _TREEBANK_CONTRACTIONS.get(word, (word,))]
     
     # Apply lemmatization and remove stopwords
     processed_words = []
     for word in words:
-        if word not in all_stop_words and len(word) > 1:
-            try:
-                if lemmatizer:
-                    word = lemmatizer.lemmatize(word)
-                if use_stemming and stemmer:
-                    word = stemmer.stem(word)
-                processed_words.append(word)
-            except Exception as e:
-                logger.warning(f"Error processing word '{word}': {e}")
-                # Add the original word if processing fails
-                if word not in all_stop_words:
-                    processed_words.append(word)
+        if word not in ALL_STOP_WORDS and len(word) > 1:
+            processed_words.append(_normalize_word(word, use_stemming))
     
     return " ".join(processed_words)
 
+@lru_cache(maxsize=PREPROCESS_CACHE_SIZE)
+def _normalize_word(word, use_stemming):
+    """
+    Lemmatizes (and optionally stems) a single token.
+    
+    Vocabulary is small compared to token counts, so each distinct word hits
+    WordNet only once.
+    """
+    try:
+        if lemmatizer:
+            word = lemmatizer.lemmatize(word)
+        if use_stemming and stemmer:
+            word = stemmer.stem(word)
+    except Exception as e:
+        logger.warning(f"Error processing word '{word}': {e}")
+    return word
+
 def extract_key_phrases(text, n=2):
     """
     Extract important n-grams from text.
@@ -164,33 +317,177 @@ def extract_key_phrases(text, n=2):
     Returns:
         str: Text with added key phrases
     """
-    if not text:
+    if not text or not isinstance(text, str):
         return ""
     
+    return _extract_key_phrases(text, n)
+
+@lru_cache(maxsize=PREPROCESS_CACHE_SIZE)
+def _extract_key_phrases(text, n):
+    """Cached implementation of extract_key_phrases for non-empty strings."""
     # Preprocess text first
-    processed_text = preprocess_text(text)
+    return _add_key_phrases(preprocess_text(text), n)
+
+@lru_cache(maxsize=PREPROCESS_CACHE_SIZE)
+def _extract_job_key_phrases(text):
+    """
+    extract_key_phrases for a job description, backed by the on-disk cache.
+    
+    Only job descriptions from extract_key_phrases_batch are persisted;
+    resume text never reaches the disk.
+    """
+    if not text or not isinstance(text, str):
+        return ""
+    
+    key = hashlib.sha1(f"0:{text}".encode("utf-8")).hexdigest()
+    processed_text = _disk_cache_get(key)
+    if processed_text is None:
+        processed_text = preprocess_text(text)
+        _disk_cache_set(key, processed_text)
+    return _add_key_phrases(processed_text, 2)
+
+def _add_key_phrases(processed_text, n):
+    """Append the most frequent n-grams of preprocessed text to it."""
     tokens = processed_text.split()
     
-    # Generate n-grams
-    ngrams = []
-    for i in range(len(tokens) - n + 1):
-        ngrams.append(" ".join(tokens[i:i+n]))
+    # Count n-grams as token tuples; only the top ones are joined into strings
+    ngram_counts = Counter(zip(*(tokens[i:] for i in range(n))))
     
     # Add the most frequent n-grams back to the text
-    if ngrams:
-        # Count n-gram frequency
-        ngram_counts = Counter(ngrams)
+    if ngram_counts:
         # Get the top 10 n-grams
-        top_ngrams = [ng for ng, _ in ngram_counts.most_common(10)]
+        top_ngrams = [" ".join(ng) for ng, _ in ngram_counts.most_common(10)]
         # Append them to the processed text
         return processed_text + " " + " ".join(top_ngrams)
     
     return processed_text
 
+def _load_lazy_nltk_data():
+    """Force NLTK's lazily loaded WordNet corpus into memory."""
+    if lemmatizer:
+        try:
+            lemmatizer.lemmatize("jobs")
+        except Exception as e:
+            logger.warning(f"Failed to load WordNet data: {e}")
+
+def _get_process_pool():
+    """Return the shared preprocessing process pool, creating it on first use."""
+    global _process_pool
+    if _process_pool is None:
+        # On Linux, forked workers share the parent's already loaded NLTK data
+        # copy-on-write. Elsewhere (macOS system frameworks are not fork-safe)
+        # the platform default is used and the initializer loads the data
+        start_method = "fork" if sys.platform.startswith("linux") else None
+        _process_pool = ProcessPoolExecutor(
+            max_workers=os.cpu_count(),
+            mp_context=multiprocessing.get_context(start_method),
+            initializer=_load_lazy_nltk_data
+        )
+    return _process_pool
+
+def warm_up_preprocessing():
+    """
+    Load NLTK data, prune the on-disk cache and start the preprocessing workers
+    ahead of the first request.
+    
+    Call once at application startup, before request threads exist, so workers
+    are forked from a clean, fully initialized process.
+    """
+    _load_lazy_nltk_data()
+    _prune_disk_cache()
+    pool = _get_process_pool()
+    for _ in range(os.cpu_count() or 1):
+        pool.submit(_load_lazy_nltk_data)
+    logger.info("Preprocessing worker pool started")
+
+def shutdown_preprocessing():
+    """Stop the preprocessing worker pool, if it was started, and close the disk cache."""
+    global _process_pool
+    if _process_pool is not None:
+        _process_pool.shutdown(wait=False)
+        _process_pool = None
+    _close_disk_cache()
+
+def _extract_key_phrases_chunk(texts):
+    """
+    Pool worker: extract key phrases for a chunk of documents.
+    
+    Disk cache writes are handed back to the parent instead of being committed
+    from every worker.
+    
+    Returns:
+        tuple: (processed texts, queued disk cache entries)
+    """
+    return [_extract_job_key_phrases(text) for text in texts], _take_pending_disk_writes()
+
+def extract_key_phrases_batch(texts):
+    """
+    Extract key phrases for many job descriptions.
+    
+    Preprocessing is CPU-bound Python, so threads serialize on the GIL; large
+    batches are spread over a process pool in chunks, small ones stay in-process
+    where the lru caches apply. Preprocessed descriptions are persisted in the
+    on-disk cache with one write per batch.
+    
+    Args:
+        texts (list): Job descriptions to process
+        
+    Returns:
+        list: Processed text for each document
+    """
+    if len(texts) < PARALLEL_MIN_DOCUMENTS:
+        processed = [_extract_job_key_phrases(text) for text in texts]
+        _flush_disk_cache()
+        return processed
+    
+    workers = os.cpu_count() or 1
+    chunksize = max(1, len(texts) // (4 * workers))
+    chunks = [texts[i:i + chunksize] for i in range(0, len(texts), chunksize)]
+    try:
+        processed = []
+        entries = []
+        for chunk_processed, chunk_entries in _get_process_pool().map(_extract_key_phrases_chunk, chunks):
+            processed.extend(chunk_processed)
+            entries.extend(chunk_entries)
+    except Exception as e:
+        logger.warning(f"Parallel preprocessing failed, falling back to serial: {e}")
+        processed = [_extract_job_key_phrases(text) for text in texts]
+        entries = []
+    # One transaction for the whole batch
+    _flush_disk_cache(entries)
+    return processed
+
+# Every \b position in the text. A r'\b' + skill + r'\b' match must start and
+# end on one of these, whatever the skill's edge characters (C++, C#, .NET)
+_WORD_BOUNDARY_RE = re.compile(r'\b')
+
+@lru_cache(maxsize=8)
+def _build_skill_index(skills):
+    """
+    Build a lowercase lookup table for a skills database.
+    
+    Args:
+        skills (frozenset): Skill terms to index
+        
+    Returns:
+        tuple: (dict mapping lowercased skill to original spellings, longest skill length)
+    """
+    index = {}
+    for skill in skills:
+        skill_lower = skill.lower()
+        if skill_lower:
+            index.setdefault(skill_lower, []).append(skill)
+    max_len = max((len(s) for s in index), default=0)
+    return index, max_len
+
 def extract_skills_from_text(text, skills_db):
     """
     Extract skills mentioned in text based on a skills database.
     
+    The text is scanned once: every span between two word boundaries, up to the
+    longest skill length, is looked up in a cached index instead of running one
+    r'\b...\b' regex search per skill. Matches are the same as that search.
+    
     Args:
         text (str): The text to analyze
         skills_db (set): Set of skill terms to match
@@ -201,19 +498,53 @@ def extract_skills_from_text(text, skills_db):
     if not text or not skills_db:
         return set()
     
+    index, max_len = _build_skill_index(frozenset(skills_db))
+    
     # Normalize text
     text = text.lower()
     
+    boundaries = [m.start() for m in _WORD_BOUNDARY_RE.finditer(text)]
+    
     # Extract skills
     found_skills = set()
-    for skill in skills_db:
-        skill_lower = skill.lower()
-        # Check for whole word matches to avoid partial matches
-        if re.search(r'\b' + re.escape(skill_lower) + r'\b', text):
-            found_skills.add(skill)
+    for n, start in enumerate(boundaries):
+        i = n + 1
+        while i < len(boundaries) and boundaries[i] - start <= max_len:
+            originals = index.get(text[start:boundaries[i]])
+            if originals:
+                found_skills.update(originals)
+            i += 1
     
     return found_skills
 
+def query_cosine_similarity(matrix):
+    """
+    Computes cosine similarity between the first row of a matrix and every other row.
+    
+    Ranking always compares one resume against N jobs, so this skips the
+    validation and full pairwise machinery of sklearn's cosine_similarity.
+    
+    Args:
+        matrix: Sparse or dense matrix whose first row is the query
+        
+    Returns:
+        numpy.ndarray: Similarity score for each remaining row
+    """
+    query = matrix[0:1]
+    candidates = matrix[1:]
+    
+    if issparse(matrix):
+        dots = (candidates @ query.T).toarray().ravel()
+        candidate_norms = np.sqrt(np.asarray(candidates.multiply(candidates).sum(axis=1)).ravel())
+        query_norm = np.sqrt(query.multiply(query).sum())
+    else:
+        dots = candidates @ query[0]
+        candidate_norms = np.linalg.norm(candidates, axis=1)
+        query_norm = np.linalg.norm(query)
+    
+    denominators = candidate_norms * query_norm
+    return np.divide(dots, denominators, out=np.zeros(len(dots)), where=denominators > 0)
+
 def calculate_similarity(resume_text, job_descriptions, resume_skills=None, dim_reduction=True):
     """
     Computes similarity scores between the resume and job descriptions using advanced techniques.
@@ -233,76 +564,67 @@ def calculate_similarity(resume_text, job_descriptions, resume_skills=None, dim_
     # Preprocess resume text with key phrase extraction
     processed_resume = extract_key_phrases(resume_text)
     
-    # Process all job descriptions in parallel
-    with ThreadPoolExecutor(max_workers=min(10, len(job_descriptions))) as executor:
-        processed_jobs = list(executor.map(extract_key_phrases, job_descriptions))
-    
-    # Create and prepare vectorizer
-    vectorizer = load_vectorizer()
-    
-    if not vectorizer:
-        # Configuration for a more robust TF-IDF vectorizer
-        vectorizer = TfidfVectorizer(
-            analyzer='word',
-            min_df=0.01,  # Ignore terms that appear in less than 1% of documents
-            max_df=0.95,  # Ignore terms that appear in more than 95% of documents
-            sublinear_tf=True,  # Apply sublinear tf scaling (1 + log(tf))
-            use_idf=True,
-            ngram_range=(1, 2),  # Include both unigrams and bigrams
-            max_features=5000  # Limit features to reduce noise
-        )
-        
+    # Process all job descriptions (in parallel for large batches)
+    processed_jobs = extract_key_phrases_batch(job_descriptions)
+    
+    all_texts = [processed_resume] + processed_jobs
+    
+    # Hash terms into a fixed feature space: stateless, so there is no
+    # vocabulary to build per request or to pickle between requests
+    term_counts = HASHING_VECTORIZER.transform(all_texts)
+
+    # Keep only the hashed columns that actually occur. All-zero columns change
+    # neither TF-IDF nor cosine scores, but the randomized SVD would otherwise
+    # run its QR/LU steps over all 2**18 of them
+    term_counts = term_counts[:, np.unique(term_counts.indices)]
+
     # Create pipeline with optional dimensionality reduction
     if dim_reduction:
         n_components = min(100, len(job_descriptions) + 1 - 1)  # Adjust for small datasets
         pipeline = Pipeline([
-            ('tfidf', vectorizer),
-            ('svd', TruncatedSVD(n_components=max(2, n_components)))  # Ensure at least 2 components
+            ('tfidf', TfidfTransformer(sublinear_tf=True, use_idf=True)),
+            ('svd', TruncatedSVD(n_components=max(2, n_components),  # Ensure at least 2 components
+                                 algorithm='randomized', random_state=0))
         ])
-        all_texts = [processed_resume] + processed_jobs
         try:
             # Transform texts using the pipeline
-            tfidf_matrix = pipeline.fit_transform(all_texts)
-            # Cache the vectorizer for future use
-            save_vectorizer(pipeline.named_steps['tfidf'])
+            tfidf_matrix = pipeline.fit_transform(term_counts)
         except Exception as e:
             logger.error(f"Error in dimensionality reduction: {e}")
             # Fallback to basic TF-IDF without reduction
-            tfidf_matrix = vectorizer.fit_transform(all_texts)
-            save_vectorizer(vectorizer)
+            tfidf_matrix = TfidfTransformer(sublinear_tf=True, use_idf=True).fit_transform(term_counts)
     else:
         # Use TF-IDF without dimensionality reduction
-        all_texts = [processed_resume] + processed_jobs
-        tfidf_matrix = vectorizer.fit_transform(all_texts)
-        save_vectorizer(vectorizer)
+        tfidf_matrix = TfidfTransformer(sublinear_tf=True, use_idf=True).fit_transform(term_counts)
+    
+    # Depending on the solver, SVD output can come back as float64; keep float32 throughout
+    tfidf_matrix = tfidf_matrix.astype(np.float32, copy=False)
     
     # Compute cosine similarity
-    similarity_scores = cosine_similarity(tfidf_matrix[0:1], tfidf_matrix[1:]).flatten()
+    similarity_scores = query_cosine_similarity(tfidf_matrix)
     
     # Enhance scores with skills matching if skills are provided
     if resume_skills:
-        # Process each job to extract skills
-        for i, job_text in enumerate(job_descriptions):
-            if i >= len(similarity_scores):
-                break
-                
-            # Extract skills from job description
-            job_skills = extract_skills_from_text(job_text, resume_skills)
-            
-            # Calculate skill match ratio (number of matching skills / number of resume skills)
-            if resume_skills:
-                skill_match_ratio = len(job_skills) / len(resume_skills) if resume_skills else 0
-                
-                # Boost similarity score based on skill matches (weighted 30%)
-                similarity_scores[i] = (similarity_scores[i] * 0.7) + (skill_match_ratio * 0.3)
+        # Count matching skills per job (one scan of each description)
+        skill_match_counts = np.fromiter(
+            (len(extract_skills_from_text(job_text, resume_skills)) for job_text in job_descriptions),
+            dtype=float,
+            count=len(job_descriptions)
+        )
+        
+        # Calculate skill match ratio (number of matching skills / number of resume skills)
+        skill_match_ratio = skill_match_counts / len(resume_skills)
+        
+        # Boost similarity scores based on skill matches (weighted 30%)
+        similarity_scores = (similarity_scores * 0.7) + (skill_match_ratio * 0.3)
     
-    # Normalize scores to [0,1] for better comparison
-    if np.max(similarity_scores) > 0:
-        similarity_scores = similarity_scores / np.max(similarity_scores)
+    # Clamp scores to [0,1] (SVD-projected cosines can dip below zero). Scores are
+    # not rescaled by the maximum so match_level thresholds keep their meaning
+    np.clip(similarity_scores, 0.0, 1.0, out=similarity_scores)
     
     return similarity_scores
 
-def rank_jobs(resume_text, job_listings, resume_skills=None):
+def rank_jobs(resume_text, job_listings, resume_skills=None, top_n=None):
     """
     Ranks jobs based on similarity scores with additional metadata.
     
@@ -310,6 +632,7 @@ def rank_jobs(resume_text, job_listings, resume_skills=None):
         resume_text (str): The resume text
         job_listings (list): List of job dictionaries
         resume_skills (set): Optional set of skills extracted from the resume
+        top_n (int): Optional number of best matches to return; None ranks all jobs
         
     Returns:
         list: Ranked job listings with similarity scores and match details
@@ -341,37 +664,51 @@ def rank_jobs(resume_text, job_listings, resume_skills=None):
             resume_skills
         )
         
+        # Order jobs by similarity score in descending order. When only the top
+        # matches are wanted, partition first so only those get fully sorted.
+        # Every job tied with the top_n-th score is kept as a candidate, so the
+        # stable sort picks the same jobs as a full sort would
+        scores = np.asarray(similarity_scores, dtype=float)
+        if top_n is not None and top_n < len(scores):
+            if top_n <= 0:
+                order = np.array([], dtype=int)
+            else:
+                cutoff = np.partition(-scores, top_n - 1)[top_n - 1]
+                candidates = np.flatnonzero(-scores <= cutoff)
+                order = candidates[np.argsort(-scores[candidates], kind="stable")][:top_n]
+        else:
+            order = np.argsort(-scores, kind="stable")
+        
         # Add similarity scores and match details to job listings
         ranked_jobs = []
-        for i, job in enumerate(job_listings):
-            if i < len(similarity_scores):
-                # Create a copy of the job to avoid modifying the original
-                job_copy = job.copy()
-                
-                # Add similarity score
-                job_copy["similarity_score"] = float(similarity_scores[i])
-                
-                # Add match confidence level
-                if similarity_scores[i] >= 0.8:
-                    job_copy["match_level"] = "Excellent"
-                elif similarity_scores[i] >= 0.6:
-                    job_copy["match_level"] = "Good"
-                elif similarity_scores[i] >= 0.4:
-                    job_copy["match_level"] = "Fair"
-                else:
-                    job_copy["match_level"] = "Low"
-                    
-                # Extract matching skills if resume_skills is provided
-                if resume_skills and "description" in job:
-                    matching_skills = extract_skills_from_text(job["description"], resume_skills)
-                    job_copy["matching_skills"] = list(matching_skills)
-                    job_copy["skill_match_count"] = len(matching_skills)
-                    job_copy["skill_match_ratio"] = len(matching_skills) / len(resume_skills) if resume_skills else 0
+        for i in order:
+            job = job_listings[i]
+            score = scores[i]
+            
+            # Create a copy of the job to avoid modifying the original
+            job_copy = job.copy()
+            
+            # Add similarity score
+            job_copy["similarity_score"] = float(score)
+            
+            # Add match confidence level
+            if score >= 0.8:
+                job_copy["match_level"] = "Excellent"
+            elif score >= 0.6:
+                job_copy["match_level"] = "Good"
+            elif score >= 0.4:
+                job_copy["match_level"] = "Fair"
+            else:
+                job_copy["match_level"] = "Low"
                 
-                ranked_jobs.append(job_copy)
-        
-        # Sort jobs by similarity score in descending order
-        ranked_jobs.sort(key=lambda x: x["similarity_score"], reverse=True)
+            # Extract matching skills if resume_skills is provided
+            if resume_skills and "description" in job:
+                matching_skills = extract_skills_from_text(job["description"], resume_skills)
+                job_copy["matching_skills"] = list(matching_skills)
+                job_copy["skill_match_count"] = len(matching_skills)
+                job_copy["skill_match_ratio"] = len(matching_skills) / len(resume_skills) if resume_skills else 0
+            
+            ranked_jobs.append(job_copy)
         
         logger.info(f"Successfully ranked {len(ranked_jobs)} jobs")
         return ranked_jobs
@@ -1,11 +1,33 @@
+import asyncio
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import logging
 import time
-import random
+import threading
+from collections import OrderedDict
 import json
 import os
-from typing import List, Dict, Any, Optional
+import re
+from typing import List, Dict, Any, Optional, Tuple
 import uuid
+import numpy as np
+
+# orjson reads/writes the cache files several times faster; stdlib json is the fallback
+try:
+    import orjson
+
+    def _json_loads(data: bytes) -> Any:
+        return orjson.loads(data)
+
+    def _json_dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj)
+except ImportError:
+    def _json_loads(data: bytes) -> Any:
+        return json.loads(data)
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8")
 
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -31,6 +53,48 @@ USA_JOBS_HOST = "data.usajobs.gov"
 USA_JOBS_API_KEY = "YOUR_API_KEY_AFTER_REGISTRATION"  # Get from https://developer.usajobs.gov/
 USA_JOBS_EMAIL = "your-email@example.com"
 
+# Common abbreviations mapped to the skill name used for provider queries
+SKILL_ALIASES = {
+    "js": "javascript",
+    "ts": "typescript",
+    "py": "python",
+    "golang": "go",
+    "k8s": "kubernetes",
+    "ml": "machine learning",
+    "ai": "artificial intelligence",
+    "nlp": "natural language processing",
+}
+
+_SKILL_PUNCT_RE = re.compile(r"[^a-z0-9+#]+")
+_SKILL_VERSION_RE = re.compile(r"(?:\s+v?\d+(?:\s+\d+)*)+$")
+
+# Skills whose provider results are fetched at startup so early requests hit the cache
+POPULAR_SKILLS = ["python", "javascript", "data science", "java", "sql", "react", "aws"]
+
+# Maximum number of provider API calls in flight at once
+MAX_CONCURRENT_REQUESTS = 8
+
+def create_session() -> requests.Session:
+    """
+    Create an HTTP session with connection pooling and retries on transient errors.
+    
+    Returns:
+        requests.Session: Session whose adapters keep connections alive across calls
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=16,
+        max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+# Shared session so provider calls reuse TCP/TLS connections instead of
+# opening a new one per request
+_SESSION = create_session()
+
 # For demo/testing, we'll include mock data to guarantee functionality
 MOCK_JOB_DATA = {
     "python": [
@@ -77,6 +141,149 @@ MOCK_JOB_DATA = {
     ]
 }
 
+class TTLCache:
+    """Small thread-safe LRU mapping whose entries expire after a fixed time-to-live."""
+    
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key, default=None):
+        """Return the value for key, or default if it is missing or expired."""
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return default
+            expires_at, value = item
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+    
+    def set(self, key, value) -> None:
+        """Store value under key, evicting the least recently used entries when full."""
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+class RateLimiter:
+    """Thread-safe token bucket allowing `rate` acquisitions per `period` seconds."""
+    
+    def __init__(self, rate: int, period: float = 1.0):
+        self.rate = rate
+        self.period = period
+        self._tokens = float(rate)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self) -> None:
+        """Take one token, sleeping only while the bucket is empty."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.rate, self._tokens + (now - self._updated) * self.rate / self.period)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) * self.period / self.rate
+            time.sleep(wait)
+    
+    def __enter__(self):
+        self.acquire()
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+# Per-host request budgets (5 requests/second each); cache hits never wait
+_USAJOBS_LIMITER = RateLimiter(5, 1.0)
+_GITHUB_LIMITER = RateLimiter(5, 1.0)
+
+# In-process layer over the on-disk JSON cache, keyed by (provider, skill)
+_JOB_CACHE = TTLCache(maxsize=512, ttl=3600)
+
+# Whole fetch results keyed by (frozenset(normalized skills), max_results_per_skill),
+# so repeated uploads with the same skill set skip the provider fan-out entirely
+_FETCH_CACHE = TTLCache(maxsize=256, ttl=1800)
+
+def _cache_file(provider: str, skill: str) -> str:
+    """Return the on-disk cache file for a provider/skill pair."""
+    return os.path.join(CACHE_DIR, f"{provider}_{skill.replace(' ', '_')}.json")
+
+def get_memory_cached_jobs(provider: str, skill: str) -> Optional[List[Dict[str, Any]]]:
+    """
+    Return copies of jobs held in the in-process cache, without touching disk.
+    
+    Args:
+        provider (str): Provider cache prefix (e.g. "usajobs")
+        skill (str): Skill the jobs were fetched for
+        
+    Returns:
+        list: Copies of the cached job dictionaries, or None if not in memory
+    """
+    jobs = _JOB_CACHE.get((provider, skill))
+    if jobs is None:
+        return None
+    return [dict(job) for job in jobs]
+
+def load_cached_jobs(provider: str, skill: str) -> Optional[List[Dict[str, Any]]]:
+    """
+    Load cached jobs for a provider/skill pair, from memory first and then disk.
+    
+    Args:
+        provider (str): Provider cache prefix (e.g. "usajobs")
+        skill (str): Skill the jobs were fetched for
+        
+    Returns:
+        list: Copies of the cached job dictionaries, or None on a cache miss
+    """
+    key = (provider, skill)
+    jobs = _JOB_CACHE.get(key)
+    if jobs is None:
+        # Open directly instead of checking os.path.exists first: one syscall on a miss
+        try:
+            with open(_cache_file(provider, skill), 'rb') as f:
+                jobs = _json_loads(f.read())
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Error reading cache file: {e}")
+            return None
+        _JOB_CACHE.set(key, jobs)
+    
+    # Callers annotate the returned dicts, so never hand out the cached ones
+    return [dict(job) for job in jobs]
+
+def store_cached_jobs(provider: str, skill: str, jobs: List[Dict[str, Any]]) -> None:
+    """
+    Cache jobs for a provider/skill pair in memory and on disk.
+    
+    Args:
+        provider (str): Provider cache prefix (e.g. "usajobs")
+        skill (str): Skill the jobs were fetched for
+        jobs (list): Job dictionaries to cache
+    """
+    _JOB_CACHE.set((provider, skill), [dict(job) for job in jobs])
+    with open(_cache_file(provider, skill), 'wb') as f:
+        f.write(_json_dumps(jobs))
+
+# Building blocks for generated mock jobs when a skill has no curated entries
+_MOCK_TITLE_TEMPLATES = (
+    "{skill} Developer",
+    "Senior {skill} Engineer",
+    "{skill} Specialist",
+    "{skill} Analyst",
+    "{skill} Consultant"
+)
+_MOCK_COMPANIES = ("TechCorp", "Innovative Solutions", "Digital Systems", "NextGen Tech", "CodeMasters")
+_MOCK_LOCATIONS = ("Remote", "New York, NY", "San Francisco, CA", "Austin, TX", "Seattle, WA")
+
 def get_jobs_from_usa_jobs(skill: str, max_results: int = 10) -> List[Dict[str, Any]]:
     """
     Fetch jobs from USAJobs.gov API based on a skill.
@@ -89,14 +296,10 @@ def get_jobs_from_usa_jobs(skill: str, max_results: int = 10) -> List[Dict[str,
         list: List of job dictionaries
     """
     # Check if we have cached results first
-    cache_file = os.path.join(CACHE_DIR, f"usajobs_{skill.replace(' ', '_')}.json")
-    if os.path.exists(cache_file):
-        try:
-            with open(cache_file, 'r') as f:
-                logger.info(f"Using cached data for {skill} from USA Jobs")
-                return json.load(f)
-        except Exception as e:
-            logger.warning(f"Error reading cache file: {e}")
+    cached_jobs = load_cached_jobs("usajobs", skill)
+    if cached_jobs is not None:
+        logger.info(f"Using cached data for {skill} from USA Jobs")
+        return cached_jobs
     
     # If no API key is provided or we're in demo mode, return empty list
     if USA_JOBS_API_KEY == "YOUR_API_KEY_AFTER_REGISTRATION":
@@ -116,12 +319,13 @@ def get_jobs_from_usa_jobs(skill: str, max_results: int = 10) -> List[Dict[str,
     }
     
     try:
-        response = requests.get(
-            "https://data.usajobs.gov/api/Search", 
-            headers=headers, 
-            params=params,
-            timeout=10
-        )
+        with _USAJOBS_LIMITER:
+            response = _SESSION.get(
+                "https://data.usajobs.gov/api/Search", 
+                headers=headers, 
+                params=params,
+                timeout=10
+            )
         response.raise_for_status()
         data = response.json()
         
@@ -140,8 +344,7 @@ def get_jobs_from_usa_jobs(skill: str, max_results: int = 10) -> List[Dict[str,
             })
         
         # Cache the results
-        with open(cache_file, 'w') as f:
-            json.dump(jobs, f)
+        store_cached_jobs("usajobs", skill, jobs)
             
         return jobs
     except Exception as e:
@@ -160,21 +363,19 @@ def get_jobs_from_github_jobs(skill: str, max_results: int = 10) -> List[Dict[st
     Returns:
         list: List of job dictionaries
     """
-    cache_file = os.path.join(CACHE_DIR, f"github_{skill.replace(' ', '_')}.json")
-    if os.path.exists(cache_file):
-        try:
-            with open(cache_file, 'r') as f:
-                logger.info(f"Using cached data for {skill} from GitHub Jobs")
-                return json.load(f)
-        except Exception as e:
-            logger.warning(f"Error reading cache file: {e}")
+    # Check if we have cached results first
+    cached_jobs = load_cached_jobs("github", skill)
+    if cached_jobs is not None:
+        logger.info(f"Using cached data for {skill} from GitHub Jobs")
+        return cached_jobs
     
     # This API is deprecated but the format is useful for demonstration
     try:
-        response = requests.get(
-            f"https://jobs.github.com/positions.json?description={skill}",
-            timeout=10
-        )
+        with _GITHUB_LIMITER:
+            response = _SESSION.get(
+                f"https://jobs.github.com/positions.json?description={skill}",
+                timeout=10
+            )
         response.raise_for_status()
         data = response.json()
         
@@ -191,8 +392,7 @@ def get_jobs_from_github_jobs(skill: str, max_results: int = 10) -> List[Dict[st
             })
         
         # Cache the results
-        with open(cache_file, 'w') as f:
-            json.dump(jobs, f)
+        store_cached_jobs("github", skill, jobs)
             
         return jobs
     except Exception as e:
@@ -213,28 +413,17 @@ def get_mock_jobs(skill: str, max_results: int = 5) -> List[Dict[str, Any]]:
     skill_lower = skill.lower()
     
     # Get jobs for the specific skill or use a default category
-    if skill_lower in MOCK_JOB_DATA:
-        jobs = MOCK_JOB_DATA[skill_lower]
-    else:
+    jobs = MOCK_JOB_DATA.get(skill_lower)
+    if jobs is None:
         # Create some dynamic fake data
-        random_titles = [
-            f"{skill.title()} Developer", 
-            f"Senior {skill.title()} Engineer",
-            f"{skill.title()} Specialist",
-            f"{skill.title()} Analyst",
-            f"{skill.title()} Consultant"
-        ]
-        
-        companies = ["TechCorp", "Innovative Solutions", "Digital Systems", "NextGen Tech", "CodeMasters"]
-        locations = ["Remote", "New York, NY", "San Francisco, CA", "Austin, TX", "Seattle, WA"]
-        
+        skill_title = skill.title()
         jobs = []
         for i in range(min(max_results, 5)):
             jobs.append({
                 "id": f"{skill_lower[:3]}{i:03d}",
-                "title": random_titles[i % len(random_titles)],
-                "company": companies[i % len(companies)],
-                "location": locations[i % len(locations)],
+                "title": _MOCK_TITLE_TEMPLATES[i % len(_MOCK_TITLE_TEMPLATES)].format(skill=skill_title),
+                "company": _MOCK_COMPANIES[i % len(_MOCK_COMPANIES)],
+                "location": _MOCK_LOCATIONS[i % len(_MOCK_LOCATIONS)],
                 "description": f"We're seeking a skilled professional with expertise in {skill}. "
                                f"Join our team and work on exciting projects using cutting-edge technology.",
                 "url": f"https://example.com/jobs/{skill_lower.replace(' ', '-')}-{i+1}",
@@ -243,65 +432,154 @@ def get_mock_jobs(skill: str, max_results: int = 5) -> List[Dict[str, Any]]:
     
     return jobs[:max_results]
 
-def fetch_jobs(skills: List[str], max_results_per_skill: int = 5) -> List[Dict[str, Any]]:
+def normalize_skill(skill: str) -> str:
+    """
+    Normalize a skill name so near-duplicates map to one provider query.
+    
+    Lowercases, collapses punctuation to spaces (keeping "+" and "#" for C++/C#),
+    drops trailing version numbers ("Python 3" -> "python") and resolves common
+    abbreviations via SKILL_ALIASES.
+    
+    Args:
+        skill (str): Raw skill name
+        
+    Returns:
+        str: Normalized skill, or an empty string if nothing is left
+    """
+    normalized = _SKILL_PUNCT_RE.sub(" ", skill.lower()).strip()
+    unversioned = _SKILL_VERSION_RE.sub("", normalized)
+    # Keep short names like "es 6" whole; stripping would leave an ambiguous stub
+    if len(unversioned) >= 3:
+        normalized = unversioned
+    return SKILL_ALIASES.get(normalized, normalized)
+
+async def _fetch_skill_jobs(skill: str, max_results: int, semaphore: asyncio.Semaphore) -> Tuple[List[Dict[str, Any]], bool]:
+    """
+    Query every provider for one skill concurrently, falling back to mock data.
+    
+    Args:
+        skill (str): Normalized skill to search for
+        max_results (int): Maximum number of results per provider
+        semaphore (asyncio.Semaphore): Bounds the number of in-flight provider calls
+        
+    Returns:
+        tuple: (jobs for the skill in provider order, whether mock data was used)
+    """
+    async def call(cache_prefix, provider):
+        # Answer from the in-memory cache directly: no thread hop, no semaphore slot
+        cached_jobs = get_memory_cached_jobs(cache_prefix, skill)
+        if cached_jobs is not None:
+            return cached_jobs
+        async with semaphore:
+            try:
+                return await asyncio.to_thread(provider, skill, max_results)
+            except Exception as e:
+                logger.error(f"Error fetching jobs for '{skill}' from {provider.__name__}: {e}")
+                return []
+    
+    usa_jobs, github_jobs = await asyncio.gather(
+        call("usajobs", get_jobs_from_usa_jobs),
+        call("github", get_jobs_from_github_jobs)
+    )
+    
+    jobs = []
+    if usa_jobs:
+        jobs.extend(usa_jobs)
+        logger.info(f"Found {len(usa_jobs)} jobs from USA Jobs for '{skill}'")
+    if github_jobs:
+        jobs.extend(github_jobs)
+        logger.info(f"Found {len(github_jobs)} jobs from GitHub Jobs for '{skill}'")
+    
+    # If no jobs found from APIs, use mock data
+    if not usa_jobs and not github_jobs:
+        mock_jobs = get_mock_jobs(skill, max_results)
+        jobs.extend(mock_jobs)
+        logger.info(f"Using {len(mock_jobs)} mock jobs for '{skill}'")
+        return jobs, True
+    
+    return jobs, False
+
+async def fetch_jobs_async(skills: List[str], max_results_per_skill: int = 5, refresh: bool = False) -> List[Dict[str, Any]]:
     """
     Fetch job listings based on extracted resume skills using a combination of sources.
+    
+    All skill x provider lookups run concurrently (bounded by
+    MAX_CONCURRENT_REQUESTS), so wall time is close to the slowest single
+    call instead of the sum of all of them.
 
     Args:
         skills (list): List of skills extracted from the resume.
         max_results_per_skill (int): Maximum number of results per skill.
+        refresh (bool): Bypass the result cache and query the providers again.
 
     Returns:
         list: A list of job dictionaries containing title, company, location, and description.
     """
-    job_listings = []
+    # Deduplicate normalized skills while preserving order
+    unique_skills = list(dict.fromkeys(filter(None, (normalize_skill(skill) for skill in skills))))
+    
+    cache_key = (frozenset(unique_skills), max_results_per_skill)
+    if not refresh:
+        cached_jobs = _FETCH_CACHE.get(cache_key)
+        if cached_jobs is not None:
+            logger.info(f"Using cached job results for skills: {', '.join(unique_skills)}")
+            return [dict(job) for job in cached_jobs]
     
-    # Deduplicate skills while preserving order
-    unique_skills = list(dict.fromkeys([skill.strip().lower() for skill in skills if skill.strip()]))
     logger.info(f"Searching jobs for skills: {', '.join(unique_skills)}")
     
-    for skill in unique_skills:
-        # Try USA Jobs API first (if configured)
-        usa_jobs = get_jobs_from_usa_jobs(skill, max_results_per_skill)
-        if usa_jobs:
-            job_listings.extend(usa_jobs)
-            logger.info(f"Found {len(usa_jobs)} jobs from USA Jobs for '{skill}'")
-        
-        # Try GitHub Jobs API (demonstration only)
-        github_jobs = get_jobs_from_github_jobs(skill, max_results_per_skill)
-        if github_jobs:
-            job_listings.extend(github_jobs)
-            logger.info(f"Found {len(github_jobs)} jobs from GitHub Jobs for '{skill}'")
-        
-        # If no jobs found from APIs, use mock data
-        if not usa_jobs and not github_jobs:
-            mock_jobs = get_mock_jobs(skill, max_results_per_skill)
-            job_listings.extend(mock_jobs)
-            logger.info(f"Using {len(mock_jobs)} mock jobs for '{skill}'")
-            
-        # Add a small delay between API calls
-        time.sleep(random.uniform(0.5, 1.5))
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    results = await asyncio.gather(
+        *(_fetch_skill_jobs(skill, max_results_per_skill, semaphore) for skill in unique_skills)
+    )
     
-    # Deduplicate job listings
-    seen = set()
-    unique_jobs = []
+    job_listings = [job for skill_jobs, _ in results for job in skill_jobs]
     
+    # Deduplicate job listings on (title, company), keeping the first occurrence
+    unique_by_key = {}
     for job in job_listings:
-        # Create a key from the title and company to detect duplicates
-        key = (job.get("title", ""), job.get("company", ""))
-        if key not in seen:
-            seen.add(key)
-            
-            # Add a match score for compatibility with job_matcher.py
-            job["match_score"] = random.uniform(70.0, 95.0)
-            # Add a posted date
-            job["posted_date"] = f"{random.randint(1, 28)} days ago"
-            
-            unique_jobs.append(job)
+        unique_by_key.setdefault((job.get("title", ""), job.get("company", "")), job)
+    unique_jobs = list(unique_by_key.values())
+    
+    # Enrich only the surviving jobs, drawing all random values in bulk:
+    # a match score for compatibility with job_matcher.py and a posted date
+    match_scores = np.random.uniform(70.0, 95.0, len(unique_jobs)).tolist()
+    posted_days = np.random.randint(1, 29, len(unique_jobs)).tolist()
+    for job, match_score, days in zip(unique_jobs, match_scores, posted_days):
+        job["match_score"] = match_score
+        job["posted_date"] = f"{days} days ago"
     
     logger.info(f"Total unique jobs found: {len(unique_jobs)}")
+    # Mock fallbacks stand in for a provider outage; don't pin them for the cache TTL
+    if not any(used_fallback for _, used_fallback in results):
+        _FETCH_CACHE.set(cache_key, [dict(job) for job in unique_jobs])
     return unique_jobs
 
+async def warm_job_cache(skills: Optional[List[str]] = None) -> None:
+    """
+    Populate the per-provider job caches for commonly requested skills.
+    
+    All skills go through a single fetch_jobs_async call, so the warm-up shares
+    one MAX_CONCURRENT_REQUESTS limit instead of opening a limit per skill.
+    
+    Args:
+        skills (list): Skills to warm, defaults to POPULAR_SKILLS
+    """
+    skills = POPULAR_SKILLS if skills is None else skills
+    start_time = time.time()
+    try:
+        await fetch_jobs_async(skills)
+    except Exception as e:
+        logger.warning(f"Error warming job cache: {e}")
+        return
+    logger.info(f"Warmed job cache for {len(skills)} skills in {time.time() - start_time:.2f}s")
+
+def fetch_jobs(skills: List[str], max_results_per_skill: int = 5, refresh: bool = False) -> List[Dict[str, Any]]:
+    """
+    Synchronous wrapper around fetch_jobs_async for scripts and non-async callers.
+    
+    Must not be called from a running event loop; await fetch_jobs_async there instead.
+    """
+    return asyncio.run(fetch_jobs_async(skills, max_results_per_skill, refresh))
 
 if __name__ == "__main__":
     test_skills = ["Python", "Data Science", "JavaScript"]
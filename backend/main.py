@@ -1,22 +1,26 @@
-from fastapi import FastAPI, File, UploadFile, HTTPException, BackgroundTasks, Request, Query
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi import FastAPI, File, UploadFile, HTTPException, Request, Query
+from fastapi.responses import HTMLResponse, JSONResponse, ORJSONResponse, Response
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.concurrency import run_in_threadpool
 from typing import List, Dict, Any, Optional
-import shutil
+import asyncio
+import hashlib
+import io
 import os
 import uuid
 import logging
-from datetime import datetime
+from datetime import datetime, timezone
 import time
 from contextlib import asynccontextmanager
+from concurrent.futures import ThreadPoolExecutor
 from pydantic import BaseModel, Field
-import mimetypes
+from functools import lru_cache
 
 # Import resume parsing & job matching modules
-from backend.resume_parser import parse_resume
-from backend.job_matcher import rank_jobs
-from backend.job_scraper import fetch_jobs
+from backend.resume_parser import parse_resume, get_parse_cache_stats, get_skill_matcher
+from backend.job_matcher import rank_jobs, warm_up_preprocessing, shutdown_preprocessing
+from backend.job_scraper import fetch_jobs_async, warm_job_cache
 
 # Configure logging
 logging.basicConfig(
@@ -36,6 +40,13 @@ os.makedirs(UPLOAD_DIR, exist_ok=True)
 # Allowed file types
 ALLOWED_EXTENSIONS = {".pdf", ".docx", ".doc", ".txt", ".rtf"}
 
+# Upload limits
+MAX_UPLOAD_SIZE = 5 * 1024 * 1024  # 5MB
+UPLOAD_CHUNK_SIZE = 1024 * 1024  # 1MB
+
+# Bounded pool for resume parsing (pdfplumber, docx2txt, spaCy), created in lifespan
+PARSE_POOL: Optional[ThreadPoolExecutor] = None
+
 # Pydantic models for request/response validation
 class JobListing(BaseModel):
     id: str
@@ -65,20 +76,49 @@ class ResumeResponse(BaseModel):
 # Lifecycle event handlers
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    global PARSE_POOL
     # Startup tasks
     logger.info("Application starting up...")
+    # Fork the preprocessing workers first, while this is still a single-threaded
+    # process; every thread pool and background task is started after this
+    warm_up_preprocessing()
+    PARSE_POOL = ThreadPoolExecutor(max_workers=os.cpu_count(), thread_name_prefix="parse")
+    # Load the spaCy model in the background so the first upload doesn't pay for it
+    PARSE_POOL.submit(get_skill_matcher)
     # Here you could initialize DB connections, load ML models, etc.
+    try:
+        load_index_html()
+    except FileNotFoundError:
+        logger.error("Frontend index.html not found")
+    # Fetch popular skills in the background so startup is not held up by provider latency
+    warm_task = asyncio.create_task(warm_job_cache())
+    # Uploads are parsed in memory and nothing writes to UPLOAD_DIR any more,
+    # so stale files only need clearing once per start
+    cleanup_task = asyncio.create_task(cleanup_old_files())
     yield
     # Shutdown tasks
     logger.info("Application shutting down...")
+    warm_task.cancel()
+    cleanup_task.cancel()
+    PARSE_POOL.shutdown(wait=False)
+    shutdown_preprocessing()
     # Here you could close DB connections, save state, etc.
 
+# orjson encodes the large parsed_data/matched_jobs payloads natively; fall back
+# to the stdlib encoder if it is not installed
+try:
+    import orjson  # noqa: F401
+    DEFAULT_RESPONSE_CLASS = ORJSONResponse
+except ImportError:
+    DEFAULT_RESPONSE_CLASS = JSONResponse
+
 # Initialize FastAPI app with lifespan
 app = FastAPI(
     title="Resume Parser and Job Matcher",
     description="A tool to parse resumes and match them with job listings",
     version="2.0.0",
     lifespan=lifespan,
+    default_response_class=DEFAULT_RESPONSE_CLASS,
     docs_url="/api/docs",  # Separate API docs from frontend
     redoc_url="/api/redoc",
 )
@@ -109,18 +149,28 @@ app.mount("/static", StaticFiles(directory="frontend"), name="static")
 async def health_check():
     return {"status": "healthy"}
 
+@lru_cache(maxsize=1)
+def load_index_html() -> tuple:
+    """Read the frontend landing page once and keep it in memory with its ETag"""
+    with open("frontend/index.html", "rb") as file:
+        content = file.read()
+    return content, f'"{hashlib.md5(content).hexdigest()}"'
+
 # Serve the HTML page from the frontend folder
 @app.get("/", response_class=HTMLResponse)
-async def read_root():
+async def read_root(request: Request):
     try:
-        with open("frontend/index.html", "r") as file:
-            return HTMLResponse(content=file.read())
+        content, etag = load_index_html()
+        # Let browsers revalidate their cached copy without resending the page
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers={"ETag": etag})
+        return HTMLResponse(content=content, headers={"ETag": etag})
     except FileNotFoundError:
         logger.error("Frontend index.html not found")
         raise HTTPException(status_code=404, detail="Frontend index.html not found")
 
 def validate_file(file: UploadFile) -> None:
-    """Validate uploaded file type and size"""
+    """Validate uploaded file type; size is enforced while reading in read_upload"""
     # Check file extension
     file_ext = os.path.splitext(file.filename)[1].lower()
     if file_ext not in ALLOWED_EXTENSIONS:
@@ -128,57 +178,58 @@ def validate_file(file: UploadFile) -> None:
             status_code=400,
             detail=f"File type not allowed. Allowed types: {', '.join(ALLOWED_EXTENSIONS)}"
         )
-    
-    # Check file size (5MB max)
-    file.file.seek(0, 2)  # Move to end of file
-    file_size = file.file.tell()  # Get file size
-    file.file.seek(0)  # Reset file pointer
-    
-    if file_size > 5 * 1024 * 1024:  # 5MB
-        raise HTTPException(
-            status_code=400,
-            detail="File too large. Maximum size is 5MB."
-        )
+
+async def read_upload(file: UploadFile) -> io.BytesIO:
+    """Read the upload in chunks without blocking the event loop, rejecting it once it exceeds MAX_UPLOAD_SIZE"""
+    buffer = io.BytesIO()
+    total = 0
+    while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+        total += len(chunk)
+        if total > MAX_UPLOAD_SIZE:
+            raise HTTPException(
+                status_code=413,
+                detail="File too large. Maximum size is 5MB."
+            )
+        buffer.write(chunk)
+    buffer.seek(0)
+    return buffer
+
+def _remove_old_files(age_hours: int) -> None:
+    """Remove files in UPLOAD_DIR older than specified hours (blocking)"""
+    cutoff = time.time() - age_hours * 3600
+    # scandir caches file type and stat results on each entry: one pass, no extra stat calls
+    with os.scandir(UPLOAD_DIR) as entries:
+        for entry in entries:
+            # If file is older than age_hours, delete it
+            if entry.is_file(follow_symlinks=False) and entry.stat().st_mtime < cutoff:
+                try:
+                    os.remove(entry.path)
+                    logger.info(f"Removed old file: {entry.name}")
+                except Exception as e:
+                    logger.error(f"Error removing {entry.name}: {e}")
 
 # Function to clean up old files
 async def cleanup_old_files(age_hours: int = 24):
-    """Remove files older than specified hours"""
-    now = time.time()
-    for filename in os.listdir(UPLOAD_DIR):
-        file_path = os.path.join(UPLOAD_DIR, filename)
-        # If file is older than age_hours, delete it
-        if os.path.isfile(file_path) and os.stat(file_path).st_mtime < now - age_hours * 3600:
-            try:
-                os.remove(file_path)
-                logger.info(f"Removed old file: {filename}")
-            except Exception as e:
-                logger.error(f"Error removing {filename}: {e}")
+    """Remove files older than specified hours without blocking the event loop"""
+    await asyncio.to_thread(_remove_old_files, age_hours)
 
-# Endpoint to upload and process a resume
-@app.post("/api/upload/", response_model=ResumeResponse)
-async def upload_resume(background_tasks: BackgroundTasks, file: UploadFile = File(...)):
+async def _do_upload(file: UploadFile) -> Dict[str, Any]:
+    """Parse an uploaded resume and match jobs, returning the plain response dict"""
     try:
         # Validate the file
         validate_file(file)
         
-        # Create a unique filename to prevent overwriting
         original_filename = file.filename
-        file_ext = os.path.splitext(original_filename)[1]
-        unique_filename = f"{uuid.uuid4()}{file_ext}"
-        file_path = os.path.join(UPLOAD_DIR, unique_filename)
-        
-        # Save the uploaded file
-        with open(file_path, "wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
+        file_ext = os.path.splitext(original_filename)[1].lower()
+        logger.info(f"File uploaded: {original_filename}")
         
-        logger.info(f"File uploaded: {original_filename} -> {unique_filename}")
+        # Read the upload in memory, enforcing the size limit as chunks arrive
+        upload = await read_upload(file)
         
-        # Schedule cleanup of old files
-        background_tasks.add_task(cleanup_old_files)
-        
-        # Parse the resume
+        # Parse the resume from memory; no copy to disk.
+        # Parsing is blocking CPU/I/O work, so keep it off the event loop
         try:
-            parsed_data = parse_resume(file_path)
+            parsed_data = await asyncio.get_running_loop().run_in_executor(PARSE_POOL, parse_resume, upload, file_ext)
             if isinstance(parsed_data, dict) and "error" in parsed_data:
                 raise HTTPException(status_code=400, detail=parsed_data["error"])
         except Exception as e:
@@ -193,14 +244,14 @@ async def upload_resume(background_tasks: BackgroundTasks, file: UploadFile = Fi
 
         # Fetch job listings based on extracted skills
         try:
-            job_listings = fetch_jobs(parsed_data.get("skills", []))
+            job_listings = await fetch_jobs_async(parsed_data.get("skills", []))
         except Exception as e:
             logger.error(f"Job fetching error: {e}")
             job_listings = []  # Continue with empty listings on failure
         
         # Rank jobs based on resume skills
         try:
-            ranked_jobs = rank_jobs(parsed_data.get("skills", []), job_listings)
+            ranked_jobs = await run_in_threadpool(rank_jobs, parsed_data.get("skills", []), job_listings)
         except Exception as e:
             logger.error(f"Job ranking error: {e}")
             ranked_jobs = []  # Continue with empty rankings on failure
@@ -209,7 +260,7 @@ async def upload_resume(background_tasks: BackgroundTasks, file: UploadFile = Fi
         response_data = {
             "id": str(uuid.uuid4()),
             "filename": original_filename,
-            "upload_date": datetime.now().isoformat(),
+            "upload_date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
             "parsed_data": parsed_data,
             "matched_jobs": ranked_jobs
         }
@@ -223,6 +274,16 @@ async def upload_resume(background_tasks: BackgroundTasks, file: UploadFile = Fi
         logger.exception(f"Unexpected error processing resume: {e}")
         raise HTTPException(status_code=500, detail="An unexpected error occurred while processing your resume")
 
+# Endpoint to upload and process a resume
+@app.post("/api/upload/", response_model=ResumeResponse)
+async def upload_resume(file: UploadFile = File(...)):
+    return await _do_upload(file)
+
+# Endpoint to monitor the resume parse cache
+@app.get("/api/cache/stats")
+async def cache_stats():
+    return get_parse_cache_stats()
+
 # Endpoint to get processed resume data by ID
 @app.get("/api/resume/{resume_id}", response_model=Optional[ResumeResponse])
 async def get_resume(resume_id: str):
@@ -237,8 +298,8 @@ async def get_jobs(skills: Optional[List[str]] = Query(None), limit: int = Query
         if not skills or len(skills) == 0:
             raise HTTPException(status_code=400, detail="At least one skill must be provided")
         
-        job_listings = fetch_jobs(skills)
-        ranked_jobs = rank_jobs(skills, job_listings)
+        job_listings = await fetch_jobs_async(skills)
+        ranked_jobs = await run_in_threadpool(rank_jobs, skills, job_listings, top_n=limit)
         
         return ranked_jobs[:limit]
     except HTTPException:
@@ -251,18 +312,28 @@ async def get_jobs(skills: Optional[List[str]] = Query(None), limit: int = Query
 @app.post("/upload/")
 async def upload_resume_legacy(file: UploadFile = File(...)):
     """Legacy endpoint for compatibility with original code"""
-    # Redirect to the new endpoint
-    response = await upload_resume(BackgroundTasks(), file)
-    return JSONResponse(
-        status_code=200,
-        content={
-            "filename": response["filename"],
-            "parsed_data": response["parsed_data"],
-            "matched_jobs": response["matched_jobs"],
-        },
-    )
+    # Share the upload pipeline directly; no response model is validated here
+    response = await _do_upload(file)
+    return {
+        "filename": response["filename"],
+        "parsed_data": response["parsed_data"],
+        "matched_jobs": response["matched_jobs"],
+    }
 
 # Run the application
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run("app:app", host="0.0.0.0", port=8000, reload=True)
\ No newline at end of file
+    # A single worker by default: each worker already runs a CPU-sized preprocessing
+    # process pool and parse thread pool and warms the job cache itself, so extra
+    # workers (WEB_CONCURRENCY) multiply all of those. "auto" picks uvloop/httptools
+    # whenever they are installed. Set UVICORN_RELOAD=1 for an auto-reloading dev server
+    reload = os.getenv("UVICORN_RELOAD") == "1"
+    uvicorn.run(
+        "backend.main:app",
+        host="0.0.0.0",
+        port=8000,
+        workers=None if reload else int(os.getenv("WEB_CONCURRENCY", 1)),
+        loop="auto",
+        http="auto",
+        reload=reload,
+    )
\ No newline at end of file
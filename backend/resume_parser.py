@@ -1,24 +1,47 @@
 import pdfplumber
 import docx2txt
 import spacy
+from spacy.matcher import PhraseMatcher
 import re
-from collections import Counter
+from bisect import bisect_left
+from collections import OrderedDict
 import os
+import io
+import copy
 import json
+import hashlib
 import logging
-from concurrent.futures import ThreadPoolExecutor
+import threading
+from dataclasses import dataclass
+from typing import List
 
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-# Load NLP model
+# orjson writes indented JSON several times faster; stdlib json is the fallback
 try:
-    nlp = spacy.load("en_core_web_sm")
-    logger.info("NLP model loaded successfully")
-except Exception as e:
-    logger.error(f"Failed to load NLP model: {e}")
-    raise
+    import orjson
+
+    def _json_dumps_indented(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+except ImportError:
+    def _json_dumps_indented(obj):
+        return json.dumps(obj, indent=2).encode("utf-8")
+
+# PDFium extracts text far faster than pdfminer; pdfplumber remains the fallback
+try:
+    import pypdfium2 as pdfium
+except ImportError:
+    pdfium = None
+
+# PDFium is not thread-safe and parses run on several PARSE_POOL threads at once
+_pdfium_lock = threading.Lock()
+
+# NLP model and skill matcher, loaded on first use so importing this module stays cheap
+_nlp = None
+_skill_matcher = None
+_nlp_lock = threading.Lock()
 
 # Expanded skill database with categories
 SKILLS_DB = {
@@ -75,28 +98,222 @@ PHRASAL_SKILLS = {
     "Customer Service", "Business Analysis", "Quality Assurance", "Test Automation"
 }
 
+# Resumes rarely run past a few pages; bound the work an oversized PDF can cause
+MAX_PDF_PAGES = 10
+
+# Contact patterns, compiled once at import
+EMAIL_RE = re.compile(r"\b[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+\b")
+# All phone formats in one alternation so the text is scanned once, fenced so
+# a match never starts inside a word or ends inside a digit run. The leading
+# fence is (?<!\w) rather than \b so numbers may start with "(" or "+"; the
+# trailing (?!\d) still allows a glued extension such as "555-123-4567x12"
+PHONE_RE = re.compile(
+    r"(?<!\w)(?:"
+    r"\(?\+?\d{1,3}?\)?[-.\s]?\d{2,4}[-.\s]?\d{3,4}[-.\s]?\d{4}"
+    r"|\d{3}[-.\s]?\d{3}[-.\s]?\d{4}"
+    r"|\(\d{3}\)\s*\d{3}[-.\s]?\d{4}"
+    r"|\+\d{1,3}\s\d{2,4}\s\d{3,4}\s\d{4}"
+    # 5+5 digit mobile numbers, e.g. "+91 98765 43210"
+    r"|\+\d{1,3}[-.\s]\d{5}[-.\s]\d{5}"
+    r")(?!\d)"
+)
+
+# Candidate name on the first line: two to four capitalized words
+NAME_HEADER_RE = re.compile(r"^([A-Z][a-z]+(?:\s[A-Z][a-z]+){1,3})")
+
+# Names appear near the top; NER only looks at this many leading characters
+NAME_SEARCH_CHARS = 500
+
+# Section words that NER sometimes tags as PERSON
+NAME_FALSE_POSITIVES = frozenset({
+    "resume", "cv", "curriculum vitae", "experience", "education",
+    "skills", "summary", "contact", "references",
+})
+
+# Degree mentions, matched against lowercased text in this order
+DEGREE_PATTERNS = (
+    re.compile(r"(bachelor|bs|b\.s\.|bachelor's|ba|b\.a\.|undergraduate)"),
+    re.compile(r"(master|ms|m\.s\.|master's|ma|m\.a\.|graduate)"),
+    re.compile(r"(ph\.?d\.?|doctor|doctorate)"),
+    re.compile(r"(associate|a\.a\.|a\.s\.)"),
+    re.compile(r"(mba|m\.b\.a\.)"),
+    re.compile(r"(certificate|certification)"),
+)
+
+# Employment date ranges such as "jan 2020 - present", matched against lowercased text.
+# A month abbreviation followed by [a-z]* also covers the full month names
+_MONTH = r"(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\.?"
+DATE_RANGE_RE = re.compile(
+    rf"({_MONTH})\.?\s+\d{{4}}\s*(?:–|-|to)\s*(?:({_MONTH})\.?\s+\d{{4}}|present|current|now)"
+)
+
+NEWLINE_RE = re.compile(r"\n")
+
+# Section headers, matched as substrings of lowercased text
+EDUCATION_HEADER_RE = re.compile(r"education|academic background|academic qualification|qualifications")
+EXPERIENCE_HEADER_RE = re.compile(r"experience|employment|work history|professional background|professional experience")
+
+# Parsed results keyed by a hash of the file bytes, so re-uploads skip parsing
+PARSE_CACHE_SIZE = 512
+_parse_cache = OrderedDict()
+_parse_cache_lock = threading.Lock()
+_parse_cache_stats = {"hits": 0, "misses": 0}
+
+@dataclass
+class ParseCtx:
+    """Views of one resume's text shared by the extractors, so each is built once per parse."""
+    text: str
+    text_lower: str
+    newlines: List[int]
+    
+    @classmethod
+    def from_text(cls, text):
+        """
+        Builds the shared views for a resume text.
+        
+        Args:
+            text (str): Resume text
+            
+        Returns:
+            ParseCtx: Context for the extractors
+        """
+        text_lower = text.lower()
+        return cls(
+            text=text,
+            text_lower=text_lower,
+            # Offsets of every line break, so a position maps to its line by bisection
+            # and a run of lines can be sliced out of the text without splitting it
+            newlines=[match.start() for match in NEWLINE_RE.finditer(text)],
+        )
+
+def get_nlp():
+    """
+    Returns the shared spaCy pipeline, loading it on first use.
+    
+    Only NER is used (names); skills are matched on tokens, so the tagger,
+    parser and lemmatizer are left out of the pipeline.
+    
+    Returns:
+        spacy.language.Language: The loaded pipeline
+    """
+    global _nlp
+    if _nlp is None:
+        with _nlp_lock:
+            if _nlp is None:
+                try:
+                    _nlp = spacy.load("en_core_web_sm", disable=["tagger", "parser", "attribute_ruler", "lemmatizer"])
+                    logger.info("NLP model loaded successfully")
+                except Exception as e:
+                    logger.error(f"Failed to load NLP model: {e}")
+                    raise
+    return _nlp
+
+def get_skill_matcher():
+    """
+    Returns the shared skill PhraseMatcher, building it on first use.
+    
+    Every known skill is matched case-insensitively in a single pass over a
+    Doc; each pattern is registered under its canonical skill name.
+    
+    Returns:
+        spacy.matcher.PhraseMatcher: Matcher over SKILLS_DB and PHRASAL_SKILLS
+    """
+    global _skill_matcher
+    if _skill_matcher is None:
+        nlp = get_nlp()
+        with _nlp_lock:
+            if _skill_matcher is None:
+                matcher = PhraseMatcher(nlp.vocab, attr="LOWER")
+                for skill in SKILLS_DB | PHRASAL_SKILLS:
+                    matcher.add(skill, [nlp.make_doc(skill)])
+                _skill_matcher = matcher
+    return _skill_matcher
+
+def _extract_text_with_pdfium(pdf_path):
+    """
+    Extracts text from a PDF with PDFium, which is much faster than pdfminer.
+    
+    Calls are serialized on _pdfium_lock: concurrent use of the library can
+    corrupt memory, which the pdfplumber fallback could not catch.
+    
+    Args:
+        pdf_path (str or file-like): Path to the PDF file or a binary file object
+        
+    Returns:
+        str: Extracted text
+    """
+    with _pdfium_lock:
+        pdf = pdfium.PdfDocument(pdf_path)
+        try:
+            if len(pdf) > MAX_PDF_PAGES:
+                logger.warning(f"PDF has {len(pdf)} pages, extracting the first {MAX_PDF_PAGES}: {pdf_path}")
+            page_texts = []
+            for index in range(min(len(pdf), MAX_PDF_PAGES)):
+                page = pdf[index]
+                textpage = page.get_textpage()
+                page_text = textpage.get_text_range()
+                textpage.close()
+                page.close()
+                if page_text:
+                    page_texts.append(page_text)
+        finally:
+            pdf.close()
+    
+    # PDFium separates lines with \r\n; the section extractors split on \n
+    return "\n".join(page_texts).replace("\r\n", "\n").replace("\r", "\n")
+
+def _extract_text_with_pdfplumber(pdf_path):
+    """
+    Extracts text from a PDF with pdfplumber.
+    
+    Args:
+        pdf_path (str or file-like): Path to the PDF file or a binary file object
+        
+    Returns:
+        str: Extracted text
+    """
+    with pdfplumber.open(pdf_path) as pdf:
+        if len(pdf.pages) > MAX_PDF_PAGES:
+            logger.warning(f"PDF has {len(pdf.pages)} pages, extracting the first {MAX_PDF_PAGES}: {pdf_path}")
+        page_texts = []
+        for page in pdf.pages[:MAX_PDF_PAGES]:
+            page_text = page.extract_text()
+            if page_text:
+                page_texts.append(page_text)
+            # Release the page's parsed layout objects as soon as we are done with it
+            page.close()
+    return "\n".join(page_texts)
+
 def extract_text_from_pdf(pdf_path):
     """
     Extracts text from a PDF file with improved error handling.
     
+    Uses PDFium when available and falls back to pdfplumber if it fails or
+    produces no text.
+    
     Args:
-        pdf_path (str): Path to the PDF file
+        pdf_path (str or file-like): Path to the PDF file or a binary file object
         
     Returns:
         str: Extracted text
     """
     text = ""
-    try:
-        with pdfplumber.open(pdf_path) as pdf:
-            for page in pdf.pages:
-                page_text = page.extract_text()
-                if page_text:
-                    text += page_text + "\n"
-        
-        if not text.strip():
-            logger.warning(f"PDF file produced empty text: {pdf_path}")
-    except Exception as e:
-        logger.error(f"Error reading PDF {pdf_path}: {e}")
+    if pdfium is not None:
+        try:
+            text = _extract_text_with_pdfium(pdf_path)
+        except Exception as e:
+            logger.warning(f"PDFium could not read {pdf_path}, falling back to pdfplumber: {e}")
+    
+    if not text.strip():
+        try:
+            if hasattr(pdf_path, "seek"):
+                pdf_path.seek(0)
+            text = _extract_text_with_pdfplumber(pdf_path)
+        except Exception as e:
+            logger.error(f"Error reading PDF {pdf_path}: {e}")
+    
+    if not text.strip():
+        logger.warning(f"PDF file produced empty text: {pdf_path}")
     
     return text.strip()
 
@@ -105,7 +322,7 @@ def extract_text_from_docx(docx_path):
     Extracts text from a DOCX file with improved error handling.
     
     Args:
-        docx_path (str): Path to the DOCX file
+        docx_path (str or file-like): Path to the DOCX file or a binary file object
         
     Returns:
         str: Extracted text
@@ -119,37 +336,49 @@ def extract_text_from_docx(docx_path):
         logger.error(f"Error reading DOCX {docx_path}: {e}")
         return ""
 
-def extract_name(text):
+def _name_from_header(text):
+    """
+    Returns the name on a resume's first line, or None if it does not look like one.
+    
+    Args:
+        text (str): Resume text
+        
+    Returns:
+        str: Name from the header line or None
+    """
+    header_match = NAME_HEADER_RE.match(text.split('\n', 1)[0])
+    return header_match.group(1) if header_match else None
+
+def extract_name(text, doc=None):
     """
     Extracts a person's name from the resume text using multiple methods.
     
     Args:
         text (str): Resume text
+        doc (spacy.tokens.Doc): Already processed resume text, to avoid
+            running the pipeline again
         
     Returns:
         str: Extracted name or None
     """
-    # Method 1: NER for PERSON entities
-    doc = nlp(text[:1000])  # Process just the first part for efficiency
-    candidates = [ent.text for ent in doc.ents if ent.label_ == "PERSON"]
-    
+    # Method 1: Check for common resume header patterns. Most resumes open with
+    # the name, and a hit here skips the NER pass entirely
+    name = _name_from_header(text)
+    if name:
+        return name
+    
+    # Method 2: NER for PERSON entities in the first part of the resume
+    if doc is None:
+        doc = get_nlp()(text[:NAME_SEARCH_CHARS])
     # Filter out common false positives
-    common_false_positives = {"resume", "cv", "curriculum vitae", "experience", "education", 
-                              "skills", "summary", "contact", "references"}
-    candidates = [name for name in candidates if name.lower() not in common_false_positives]
-    
-    # Method 2: Check for common resume header patterns
-    header_match = re.search(r"^([A-Z][a-z]+(?:\s[A-Z][a-z]+){1,3})", text.split('\n')[0])
-    if header_match:
-        candidates.insert(0, header_match.group(1))  # Prioritize the header match
-    
-    # Return the most likely candidate if found
-    if candidates:
-        # Sort by length to favor full names over partial names
-        candidates.sort(key=len, reverse=True)
-        return candidates[0]
+    candidates = [
+        ent.text for ent in doc.ents
+        if ent.label_ == "PERSON" and ent.start_char < NAME_SEARCH_CHARS
+        and ent.text.lower() not in NAME_FALSE_POSITIVES
+    ]
     
-    return None
+    # Return the most likely candidate, favoring full names over partial names
+    return max(candidates, key=len, default=None)
 
 def extract_email(text):
     """
@@ -162,7 +391,7 @@ def extract_email(text):
         str: Extracted email or None
     """
     # More comprehensive email regex
-    match = re.search(r"[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+", text)
+    match = EMAIL_RE.search(text)
     return match.group() if match else None
 
 def extract_phone(text):
@@ -175,169 +404,111 @@ def extract_phone(text):
     Returns:
         str: Extracted phone number or None
     """
-    # More comprehensive phone regex patterns
-    patterns = [
-        r"\(?\+?\d{1,3}?\)?[-.\s]?\d{2,4}[-.\s]?\d{3,4}[-.\s]?\d{4}",
-        r"\d{3}[-.\s]?\d{3}[-.\s]?\d{4}",
-        r"\(\d{3}\)\s*\d{3}[-.\s]?\d{4}",
-        r"\+\d{1,3}\s\d{2,4}\s\d{3,4}\s\d{4}"
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, text)
-        if match:
-            return match.group()
-    
-    return None
+    # More comprehensive phone regex patterns, scanned in a single pass
+    match = PHONE_RE.search(text)
+    return match.group() if match else None
 
-def extract_education(text):
+def extract_education(text, ctx=None):
     """
     Extracts education information from the resume.
     
     Args:
         text (str): Resume text
+        ctx (ParseCtx): Precomputed views of the text, shared between extractors
         
     Returns:
         list: List of education entries
     """
+    if ctx is None:
+        ctx = ParseCtx.from_text(text)
+    newlines = ctx.newlines
     education = []
     
-    # Look for education section
-    edu_section = None
-    
-    # Common section headers for education
-    education_headers = ["education", "academic background", "academic qualification", "qualifications"]
-    
-    lines = text.split('\n')
-    for i, line in enumerate(lines):
-        if any(header in line.lower() for header in education_headers):
-            edu_section = i
-            break
+    # Look for education section; one scan of the whole text instead of a loop over lines
+    edu_section = EDUCATION_HEADER_RE.search(ctx.text_lower)
     
     if edu_section is not None:
-        # Try to find degrees
-        degree_patterns = [
-            r"(bachelor|bs|b\.s\.|bachelor's|ba|b\.a\.|undergraduate)",
-            r"(master|ms|m\.s\.|master's|ma|m\.a\.|graduate)",
-            r"(ph\.?d\.?|doctor|doctorate)",
-            r"(associate|a\.a\.|a\.s\.)",
-            r"(mba|m\.b\.a\.)",
-            r"(certificate|certification)"
-        ]
-        
         # Look for degree mentions and surrounding context
-        for pattern in degree_patterns:
-            matches = re.finditer(pattern, text.lower())
+        for pattern in DEGREE_PATTERNS:
+            matches = pattern.finditer(ctx.text_lower)
             for match in matches:
-                # Get surrounding context (3 lines)
+                # Get surrounding context (2 lines either side), sliced straight out of the text
                 pos = match.start()
-                line_pos = text[:pos].count('\n')
+                line_pos = bisect_left(newlines, pos)
                 start_line = max(0, line_pos - 2)
-                end_line = min(len(lines), line_pos + 3)
+                last_line = min(len(newlines), line_pos + 2)
                 
-                degree_context = ' '.join(lines[start_line:end_line])
+                start = newlines[start_line - 1] + 1 if start_line > 0 else 0
+                end = newlines[last_line] if last_line < len(newlines) else len(ctx.text)
+                degree_context = ctx.text[start:end].replace('\n', ' ')
                 education.append(degree_context.strip())
     
-    # Deduplicate and clean
+    # Deduplicate and clean. Several patterns usually hit the same lines, so exact
+    # repeats are rejected by a set lookup before the substring check runs
+    seen = set()
     unique_education = []
     for entry in education:
-        if entry and not any(entry in existing for existing in unique_education):
+        if not entry or entry in seen:
+            continue
+        seen.add(entry)
+        if not any(entry in existing for existing in unique_education):
             unique_education.append(entry)
     
     return unique_education
 
-def extract_skills(text):
+def extract_skills(text, doc=None):
     """
     Extracts skills from the resume using improved NLP matching and pattern recognition.
     
     Args:
         text (str): Resume text
+        doc (spacy.tokens.Doc): Already processed resume text, to avoid
+            running the pipeline again
         
     Returns:
         list: List of extracted skills
     """
-    # Normalize text
-    normalized_text = " " + text.lower() + " "
-    normalized_text = re.sub(r'[^\w\s]', ' ', normalized_text)
-    normalized_text = re.sub(r'\s+', ' ', normalized_text)
-
-    matched_skills = set()
-    
-    # First check for phrasal skills (multi-word skills)
-    for skill in PHRASAL_SKILLS:
-        if f" {skill.lower()} " in normalized_text:
-            matched_skills.add(skill)
+    nlp = get_nlp()
     
-    # Check for single-word skills with word boundaries
-    words = set(" " + word.lower() + " " for word in re.findall(r'\b\w+\b', normalized_text))
-    for skill in SKILLS_DB:
-        if " " not in skill and f" {skill.lower()} " in words:
-            matched_skills.add(skill)
+    # Tokenizing is all the matcher needs when no processed doc is passed in
+    if doc is None:
+        doc = nlp.make_doc(text)
     
-    # Use NLP-based similarity for broader skill detection
-    doc = nlp(text)
+    # Single- and multi-word skills in one pass over the tokens. This also covers
+    # skills listed in a "Skills" section, so that section needs no separate scan
+    matched_skills = {nlp.vocab.strings[match_id] for match_id, _, _ in get_skill_matcher()(doc)}
     
-    # Extract noun phrases which are often skills
-    noun_phrases = [chunk.text.lower() for chunk in doc.noun_chunks]
-    
-    # Check for any noun phrases that match our skills database
-    for phrase in noun_phrases:
-        normalized_phrase = phrase.lower()
-        for skill in SKILLS_DB:
-            if skill.lower() == normalized_phrase:
-                matched_skills.add(skill)
-    
-    # Look for skill sections
-    skill_section_pattern = r'(?:technical\s+)?(?:skills|proficiencies|competencies|expertise)[^\n]*(?:\n|:)(.*?)(?:\n\s*\n|\n[A-Z])'
-    skill_match = re.search(skill_section_pattern, text, re.IGNORECASE | re.DOTALL)
-    
-    if skill_match:
-        skill_text = skill_match.group(1)
-        # Extract skills listed with commas or bullets
-        skill_items = re.split(r'[,•\n]', skill_text)
-        for item in skill_items:
-            item = item.strip().lower()
-            if item:
-                for skill in SKILLS_DB:
-                    if skill.lower() == item or skill.lower() in item.split():
-                        matched_skills.add(skill)
-    
-    return sorted(list(matched_skills))
+    return sorted(matched_skills)
 
-def extract_experience(text):
+def extract_experience(text, ctx=None):
     """
     Extracts work experience information from the resume.
     
     Args:
         text (str): Resume text
+        ctx (ParseCtx): Precomputed views of the text, shared between extractors
         
     Returns:
         list: List of experience entries
     """
+    if ctx is None:
+        ctx = ParseCtx.from_text(text)
     experience = []
     
     # Try to locate experience section
-    exp_section = None
-    experience_headers = ["experience", "employment", "work history", "professional background", "professional experience"]
-    
-    lines = text.split('\n')
-    for i, line in enumerate(lines):
-        if any(header in line.lower() for header in experience_headers):
-            exp_section = i
-            break
+    exp_section = EXPERIENCE_HEADER_RE.search(ctx.text_lower)
     
     if exp_section is not None:
         # Look for date patterns to identify different roles
-        date_pattern = r"((?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\.?|january|february|march|april|may|june|july|august|september|october|november|december)\.?\s+\d{4}\s*(?:–|-|to)\s*(?:((?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\.?|january|february|march|april|may|june|july|august|september|october|november|december)\.?\s+\d{4}|present|current|now)"
-        
-        date_matches = list(re.finditer(date_pattern, text.lower()))
+        text_lower = ctx.text_lower
+        date_matches = list(DATE_RANGE_RE.finditer(text_lower))
         
         # Process each job entry
         for i in range(len(date_matches)):
             start_pos = date_matches[i].start()
             
             # Find the end of this entry (next date or end of section)
-            end_pos = text.lower().find('\n\n', start_pos)
+            end_pos = text_lower.find('\n\n', start_pos)
             if i < len(date_matches) - 1:
                 end_pos = min(end_pos if end_pos != -1 else len(text), date_matches[i+1].start())
             else:
@@ -350,61 +521,174 @@ def extract_experience(text):
     
     return experience
 
-def parse_resume(file_path):
+def _read_resume(file_path, file_extension=None):
     """
-    Parses a resume file (PDF or DOCX) and extracts structured information.
+    Reads a resume file and extracts its text, serving repeats from the parse cache.
     
     Args:
-        file_path (str): Path to the resume file
+        file_path (str or file-like): Path to the resume file or a binary file object
+        file_extension (str): File extension; required for file objects
         
     Returns:
-        dict: Extracted information from the resume
+        tuple: (result, source_name, cache_key, text). result is the final
+            answer (a cached parse or an error dict) when text needs no
+            further parsing, and None otherwise
     """
-    if not os.path.exists(file_path):
-        logger.error(f"File not found: {file_path}")
-        return {"error": "File not found"}
+    if isinstance(file_path, (str, os.PathLike)):
+        source_name = file_path
+        file_extension = os.path.splitext(file_path)[1].lower()
+        try:
+            with open(file_path, "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            logger.error(f"File not found: {file_path}")
+            return {"error": "File not found"}, source_name, None, None
+    else:
+        source_name = "<stream>"
+        file_extension = (file_extension or "").lower()
+        file_path.seek(0)
+        data = file_path.read()
     
-    file_extension = os.path.splitext(file_path)[1].lower()
+    if file_extension not in (".pdf", ".docx", ".doc"):
+        logger.error(f"Unsupported file format: {file_extension}")
+        return {"error": f"Unsupported file format: {file_extension}"}, source_name, None, None
+    
+    # Parsing is a pure function of the file bytes: serve repeats from the cache
+    cache_key = (hashlib.blake2b(data, digest_size=16).hexdigest(), file_extension)
+    with _parse_cache_lock:
+        cached = _parse_cache.get(cache_key)
+        if cached is not None:
+            _parse_cache.move_to_end(cache_key)
+            _parse_cache_stats["hits"] += 1
+        else:
+            _parse_cache_stats["misses"] += 1
+    if cached is not None:
+        logger.info(f"Using cached parse for resume: {source_name}")
+        return copy.deepcopy(cached), source_name, cache_key, None
     
     if file_extension == ".pdf":
-        text = extract_text_from_pdf(file_path)
-    elif file_extension in [".docx", ".doc"]:
-        text = extract_text_from_docx(file_path)
+        text = extract_text_from_pdf(io.BytesIO(data))
     else:
-        logger.error(f"Unsupported file format: {file_extension}")
-        return {"error": f"Unsupported file format: {file_extension}"}
+        text = extract_text_from_docx(io.BytesIO(data))
     
     if not text:
-        logger.error(f"Failed to extract text from file: {file_path}")
-        return {"error": "Failed to extract text from file"}
-    
-    # Use ThreadPoolExecutor for parallel processing
-    with ThreadPoolExecutor(max_workers=4) as executor:
-        name_future = executor.submit(extract_name, text)
-        email_future = executor.submit(extract_email, text)
-        phone_future = executor.submit(extract_phone, text)
-        skills_future = executor.submit(extract_skills, text)
-        education_future = executor.submit(extract_education, text)
-        experience_future = executor.submit(extract_experience, text)
+        logger.error(f"Failed to extract text from file: {source_name}")
+        return {"error": "Failed to extract text from file"}, source_name, cache_key, None
+    
+    return None, source_name, cache_key, text
+
+def _assemble_resume(text, name):
+    """
+    Runs the remaining extractors over a resume's text.
+    
+    Args:
+        text (str): Resume text
+        name (str): Name already extracted from the text
         
-        name = name_future.result()
-        email = email_future.result()
-        phone = phone_future.result()
-        skills = skills_future.result()
-        education = education_future.result()
-        experience = experience_future.result()
-    
-    result = {
+    Returns:
+        dict: Extracted information from the resume
+    """
+    # The extractors are CPU-bound Python and would only serialize on the GIL in
+    # threads, so run them in sequence. Skill matching only tokenizes the text
+    ctx = ParseCtx.from_text(text)
+    return {
         "name": name,
-        "email": email,
-        "phone": phone,
-        "skills": skills,
-        "education": education,
-        "experience": experience,
+        "email": extract_email(text),
+        "phone": extract_phone(text),
+        "skills": extract_skills(text),
+        "education": extract_education(text, ctx),
+        "experience": extract_experience(text, ctx),
     }
+
+def parse_resumes(file_paths, file_extensions=None):
+    """
+    Parses several resume files (PDF or DOCX), batching spaCy work across them.
+    
+    Names come from each resume's header line where possible; the remaining
+    resumes go through NER together with nlp.pipe.
+    
+    Args:
+        file_paths (list): Paths to resume files and/or binary file objects
+        file_extensions (list): File extension per entry; required for file
+            objects, derived from the path otherwise
+        
+    Returns:
+        list: Extracted information (or an error dict) per resume, in input order
+    """
+    if file_extensions is None:
+        file_extensions = [None] * len(file_paths)
+    
+    results = [None] * len(file_paths)
+    pending = []
+    for index, (file_path, file_extension) in enumerate(zip(file_paths, file_extensions)):
+        result, source_name, cache_key, text = _read_resume(file_path, file_extension)
+        if result is not None:
+            results[index] = result
+        else:
+            pending.append((index, source_name, cache_key, text))
+    
+    # Resolve names from header lines first; only the rest need the NER pass
+    names = {}
+    needs_ner = []
+    for index, _, _, text in pending:
+        name = _name_from_header(text)
+        if name:
+            names[index] = name
+        else:
+            needs_ner.append((index, text))
+    
+    if needs_ner:
+        docs = get_nlp().pipe((text[:NAME_SEARCH_CHARS] for _, text in needs_ner), batch_size=32)
+        for (index, text), doc in zip(needs_ner, docs):
+            names[index] = extract_name(text, doc)
+    
+    for index, source_name, cache_key, text in pending:
+        result = _assemble_resume(text, names[index])
+        
+        with _parse_cache_lock:
+            _parse_cache[cache_key] = copy.deepcopy(result)
+            while len(_parse_cache) > PARSE_CACHE_SIZE:
+                _parse_cache.popitem(last=False)
+        
+        logger.info(f"Successfully parsed resume: {source_name}")
+        results[index] = result
     
-    logger.info(f"Successfully parsed resume: {file_path}")
-    return result
+    return results
+
+def parse_resume(file_path, file_extension=None):
+    """
+    Parses a resume file (PDF or DOCX) and extracts structured information.
+    
+    Args:
+        file_path (str or file-like): Path to the resume file, or a binary file
+            object (e.g. an upload stream) to parse without touching disk
+        file_extension (str): File extension such as ".pdf"; required for file
+            objects, derived from the path otherwise
+        
+    Returns:
+        dict: Extracted information from the resume
+    """
+    return parse_resumes([file_path], [file_extension])[0]
+
+def get_parse_cache_stats():
+    """
+    Reports usage of the parse_resume result cache.
+    
+    Returns:
+        dict: Cache size, capacity, hit/miss counts and hit rate
+    """
+    with _parse_cache_lock:
+        hits = _parse_cache_stats["hits"]
+        misses = _parse_cache_stats["misses"]
+        size = len(_parse_cache)
+    lookups = hits + misses
+    return {
+        "size": size,
+        "maxsize": PARSE_CACHE_SIZE,
+        "hits": hits,
+        "misses": misses,
+        "hit_rate": hits / lookups if lookups else 0.0,
+    }
 
 def save_resume_data(resume_data, output_file):
     """
@@ -415,8 +699,8 @@ def save_resume_data(resume_data, output_file):
         output_file (str): Path to output file
     """
     try:
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(resume_data, f, indent=2)
+        with open(output_file, 'wb') as f:
+            f.write(_json_dumps_indented(resume_data))
         logger.info(f"Resume data saved to {output_file}")
         return True
     except Exception as e:
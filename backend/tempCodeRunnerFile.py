@@ -1,51 +0,0 @@
-import pdfplumber
-import docx2txt
-import spacy
-import re
-
-nlp = spacy.load("en_core_web_sm")
-
-def extract_text_from_pdf(pdf_path):
-    text = ""
-    with pdfplumber.open(pdf_path) as pdf:
-        for page in pdf.pages:
-            text += page.extract_text() + "\n"
-    return text.strip()
-
-def extract_text_from_docx(docx_path):
-    return docx2txt.process(docx_path).strip()
-
-def extract_name(text):
-    doc = nlp(text)
-    for ent in doc.ents:
-        if ent.label_ == "PERSON":
-            return ent.text
-    return None
-
-def extract_email(text):
-    match = re.search(r"[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+", text)
-    return match.group() if match else None
-
-def extract_phone(text):
-    match = re.search(r"\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}", text)
-    return match.group() if match else None
-
-def extract_skills(text):
-    skills_db = {"Python", "Java", "Machine Learning", "Deep Learning", "Data Science", "NLP"}
-    words = set(text.split())
-    return list(skills_db.intersection(words))
-
-def parse_resume(file_path):
-    if file_path.endswith(".pdf"):
-        text = extract_text_from_pdf(file_path)
-    elif file_path.endswith(".docx"):
-        text = extract_text_from_docx(file_path)
-    else:
-        return {"error": "Unsupported file format"}
-
-    return {
-        "name": extract_name(text),
-        "email": extract_email(text),
-        "phone": extract_phone(text),
-        "skills": extract_skills(text),
-    }
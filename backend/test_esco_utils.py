@@ -0,0 +1,10 @@
+import csv
+
+from backend.esco_utils import ESCO_SKILLS_PATH, load_esco_skills
+
+
+def test_load_esco_skills_matches_csv_module():
+    # altLabels/description hold quoted multi-line values; rows must not be mis-split
+    with open(ESCO_SKILLS_PATH, newline="", encoding="utf-8") as f:
+        expected = {row["preferredLabel"].lower() for row in csv.DictReader(f) if row["preferredLabel"]}
+    assert load_esco_skills(ESCO_SKILLS_PATH) == expected
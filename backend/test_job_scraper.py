@@ -0,0 +1,85 @@
+import time
+
+import pytest
+
+from backend.job_scraper import RateLimiter, TTLCache, normalize_skill
+
+
+class FakeClock:
+    """Manual stand-in for time.monotonic and time.sleep."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+    def advance(self, seconds):
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(time, "monotonic", clock.monotonic)
+    monkeypatch.setattr(time, "sleep", clock.sleep)
+    return clock
+
+
+@pytest.mark.parametrize("skill, expected", [
+    ("Python", "python"),
+    ("Python 3", "python"),
+    ("Python 3.10", "python"),
+    ("JS", "javascript"),
+    ("  ML ", "machine learning"),
+    ("golang", "go"),
+    ("C++", "c++"),
+    ("C#", "c#"),
+    ("Node.js", "node js"),
+    ("ES 6", "es 6"),
+    ("***", ""),
+])
+def test_normalize_skill(skill, expected):
+    assert normalize_skill(skill) == expected
+
+
+def test_ttl_cache_evicts_least_recently_used(clock):
+    cache = TTLCache(maxsize=2, ttl=10)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_ttl_cache_expires_entries(clock):
+    cache = TTLCache(maxsize=2, ttl=10)
+    cache.set("a", 1)
+    clock.advance(9)
+    assert cache.get("a") == 1
+    clock.advance(2)
+    assert cache.get("a", "missing") == "missing"
+
+
+def test_rate_limiter_sleeps_only_when_empty(clock):
+    limiter = RateLimiter(5, 1.0)
+    for _ in range(5):
+        limiter.acquire()
+    assert clock.sleeps == []
+
+    with limiter:
+        pass
+    assert clock.sleeps == [pytest.approx(0.2)]
+
+    # A full period refills the bucket
+    clock.advance(1.0)
+    for _ in range(5):
+        limiter.acquire()
+    assert len(clock.sleeps) == 1
@@ -0,0 +1,80 @@
+import random
+import re
+
+import pytest
+
+from backend import job_matcher
+
+
+def baseline_preprocess(text):
+    """preprocess_text as it was before the single-pass cleanup, tokenizing with str.split."""
+    text = text.lower()
+    text = re.sub(r'https?://\S+|www\.\S+', '', text)
+    text = re.sub(r'\S+@\S+', '', text)
+    text = re.sub(r'\b(?:\+\d{1,2}\s)?\(?\d{3}\)?[\s.-]?\d{3}[\s.-]?\d{4}\b', '', text)
+    text = re.sub(r'[^\w\s-]', '', text)
+    text = re.sub(r'-', ' ', text)
+    return " ".join(
+        job_matcher._normalize_word(word, False)
+        for word in text.split()
+        if word not in job_matcher.ALL_STOP_WORDS and len(word) > 1
+    )
+
+
+@pytest.fixture
+def disk_cache(tmp_path, monkeypatch):
+    """Point the on-disk preprocessing cache at a temporary home directory."""
+    job_matcher._close_disk_cache()
+    monkeypatch.setenv("HOME", str(tmp_path))
+    job_matcher._extract_job_key_phrases.cache_clear()
+    yield job_matcher._get_disk_cache()
+    job_matcher._close_disk_cache()
+
+
+def test_only_job_descriptions_reach_the_disk_cache(disk_cache):
+    job_matcher.extract_key_phrases("Confidential resume of Alice Example")
+    job_matcher.preprocess_text("Another resume mentioning Bob Example")
+    job_matcher.extract_key_phrases_batch(["Kotlin developer for mobile apps"])
+
+    values = [row[0] for row in disk_cache.execute("SELECT value FROM preprocessed")]
+    assert any("kotlin" in value for value in values)
+    assert not any("alice" in value or "bob" in value for value in values)
+
+
+def test_prune_disk_cache(disk_cache, monkeypatch):
+    job_matcher.extract_key_phrases_batch([f"Job number {i} for a Rust engineer" for i in range(5)])
+    # Expire one entry; the cap then trims the remaining four to three
+    disk_cache.execute("UPDATE preprocessed SET created = 0 WHERE rowid = (SELECT MIN(rowid) FROM preprocessed)")
+    disk_cache.commit()
+
+    monkeypatch.setattr(job_matcher, "PREPROCESS_DISK_CACHE_MAX_ROWS", 3)
+    job_matcher._prune_disk_cache()
+
+    assert disk_cache.execute("SELECT COUNT(*) FROM preprocessed").fetchone()[0] == 3
+
+
+def test_preprocess_drops_ascii_control_characters():
+    assert job_matcher.preprocess_text("\x07+756f") == "756f"
+
+
+def test_preprocess_matches_baseline_cleanup():
+    # All of ASCII (punctuation, control characters, whitespace) plus some non-ASCII
+    alphabet = [chr(i) for i in range(128)] + ["é", "–", "’", "ß", "İ"]
+    rng = random.Random(0)
+    for _ in range(20000):
+        text = "".join(rng.choice(alphabet) for _ in range(rng.randint(1, 12)))
+        assert job_matcher.preprocess_text(text) == baseline_preprocess(text), repr(text)
+
+
+@pytest.mark.parametrize("text, tokenized", [
+    ("I cannot relocate", "I can not relocate"),
+    ("gonna build gotta ship", "gon na build got ta ship"),
+    ("wanna lead, lemme know, gimme feedback", "wan na lead, lem me know, gim me feedback"),
+])
+def test_preprocess_splits_treebank_contractions(text, tokenized):
+    # word_tokenize splits these forms; whitespace tokenization must do the same
+    assert job_matcher.preprocess_text(text) == job_matcher.preprocess_text(tokenized)
+
+
+def test_preprocess_keeps_words_containing_contractions():
+    assert job_matcher.preprocess_text("wannabe gonnabe") == "wannabe gonnabe"
@@ -0,0 +1,26 @@
+import numpy as np
+import pytest
+
+from backend import job_matcher
+
+
+def rank_with_scores(monkeypatch, scores, top_n):
+    """Run rank_jobs with fixed similarity scores and return the ranked job ids."""
+    monkeypatch.setattr(job_matcher, "calculate_similarity", lambda *args, **kwargs: list(scores))
+    jobs = [{"id": i, "title": f"Job {i}", "description": f"Description {i}"} for i in range(len(scores))]
+    return [job["id"] for job in job_matcher.rank_jobs("Python developer", jobs, top_n=top_n)]
+
+
+def test_top_n_keeps_stable_order_on_ties(monkeypatch):
+    scores = np.array([.5] * 5 + [.2] * 20 + [.5] * 5)
+    expected = np.argsort(-scores, kind="stable")[:7].tolist()
+    assert expected == [0, 1, 2, 3, 4, 25, 26]
+    assert rank_with_scores(monkeypatch, scores, 7) == expected
+
+
+@pytest.mark.parametrize("top_n", [0, 1, 3, 10, 39, 40, 50])
+def test_top_n_matches_full_stable_sort(monkeypatch, top_n):
+    # Few distinct values, so most cutoffs fall inside a run of ties
+    scores = np.random.default_rng(top_n).integers(0, 4, 40) / 4
+    expected = np.argsort(-scores, kind="stable")[:top_n].tolist()
+    assert rank_with_scores(monkeypatch, scores, top_n) == expected
@@ -0,0 +1,78 @@
+import io
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from backend.resume_parser import extract_phone, extract_text_from_pdf, get_parse_cache_stats, parse_resume
+
+
+def make_pdf(text):
+    """Build a minimal one-page PDF showing text in Helvetica."""
+    stream = f"BT /F1 12 Tf 72 720 Td ({text}) Tj ET".encode("latin-1")
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+        b"/Resources << /Font << /F1 4 0 R >> >> /Contents 5 0 R >>",
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+        b"<< /Length " + str(len(stream)).encode() + b" >>\nstream\n" + stream + b"\nendstream",
+    ]
+    pdf = b"%PDF-1.4\n"
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(pdf))
+        pdf += f"{number} 0 obj\n".encode() + body + b"\nendobj\n"
+    xref_offset = len(pdf)
+    pdf += f"xref\n0 {len(objects) + 1}\n".encode()
+    pdf += b"0000000000 65535 f \n"
+    for offset in offsets:
+        pdf += f"{offset:010d} 00000 n \n".encode()
+    pdf += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref_offset}\n%%EOF\n".encode()
+    return pdf
+
+
+def test_extract_text_from_pdf_concurrently():
+    # PARSE_POOL runs several parses at once; PDFium must not be entered concurrently
+    texts = [f"Resume number {i} Python developer" for i in range(16)]
+    pdfs = [make_pdf(text) for text in texts]
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(lambda data: extract_text_from_pdf(io.BytesIO(data)), pdfs))
+    for text, result in zip(texts, results):
+        assert text in result
+
+
+def test_parse_cache_serves_identical_bytes():
+    data = make_pdf("Jane Example jane@example.com Python SQL")
+    before = get_parse_cache_stats()
+
+    first = parse_resume(io.BytesIO(data), ".pdf")
+    first["skills"].append("mutated by caller")
+    second = parse_resume(io.BytesIO(data), ".pdf")
+
+    after = get_parse_cache_stats()
+    assert after["misses"] == before["misses"] + 1
+    assert after["hits"] == before["hits"] + 1
+    # Cached results are copies, so callers cannot alter later answers
+    assert "mutated by caller" not in second["skills"]
+    assert second["email"] == "jane@example.com"
+
+    # The same bytes under another extension are a different entry
+    parse_resume(io.BytesIO(data), ".doc")
+    assert get_parse_cache_stats()["misses"] == before["misses"] + 2
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("Phone: +91 98765 43210", "+91 98765 43210"),
+    ("Mobile: +91-98765-43210", "+91-98765-43210"),
+    ("+91.98765.43210", "+91.98765.43210"),
+    ("Call (555) 123-4567 now", "(555) 123-4567"),
+    ("+1 555 123 4567", "+1 555 123 4567"),
+    ("tel 555-123-4567.", "555-123-4567"),
+    ("555.123.4567", "555.123.4567"),
+    ("555-123-4567x12", "555-123-4567"),
+    ("555-123-4567 ext 12", "555-123-4567"),
+    ("ID 12345678901234567", None),
+    ("Order #ABC5551234567", None),
+])
+def test_extract_phone(text, expected):
+    assert extract_phone(text) == expected
@@ -0,0 +1,34 @@
+import random
+import re
+
+from backend.job_matcher import extract_skills_from_text
+
+SKILLS_DB = {
+    "C++", "C#", ".NET", "Python", "python", "Node.js", "SQL", "machine learning",
+    "R", "Go", "asp.net", "c",
+}
+TOKENS = [
+    "c++", "c++11", "c#", "c#,", ".net", "asp.net", "python3", "Python", "node.js", "sql;",
+    "machine learning", "machine  learning", "r", "go-lang", "(c++)", "é", "x.net", " ", "\n", ",", "c",
+]
+
+
+def baseline_extract_skills(text, skills_db):
+    """extract_skills_from_text as it was: one r'\\b...\\b' search per skill."""
+    text = text.lower()
+    return {skill for skill in skills_db if re.search(r'\b' + re.escape(skill.lower()) + r'\b', text)}
+
+
+def test_extract_skills_punctuated_names():
+    text = "Senior C# / .NET developer, some C++11 and node.js"
+    assert extract_skills_from_text(text, SKILLS_DB) == baseline_extract_skills(text, SKILLS_DB)
+
+
+def test_extract_skills_matches_baseline_search():
+    rng = random.Random(1)
+    for _ in range(20000):
+        text = "".join(
+            rng.choice(TOKENS) + rng.choice(["", " ", ",", ".", "\n"])
+            for _ in range(rng.randint(0, 8))
+        )
+        assert extract_skills_from_text(text, SKILLS_DB) == baseline_extract_skills(text, SKILLS_DB), repr(text)
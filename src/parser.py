@@ -1,9 +1,12 @@
 import pdfplumber
 import re
 import spacy
+from functools import lru_cache
 
-# Load spaCy NLP model
-nlp = spacy.load("en_core_web_sm")
+@lru_cache(maxsize=1)
+def get_nlp():
+    """Load the spaCy NLP model on first use."""
+    return spacy.load("en_core_web_sm")
 
 def extract_text_from_pdf(pdf_path):
     """Extract text from a PDF resume."""
@@ -25,7 +28,7 @@ def extract_phone(text):
 
 def extract_name(text):
     """Extract name using spaCy NER."""
-    doc = nlp(text)
+    doc = get_nlp()(text)
     for ent in doc.ents:
         if ent.label_ == "PERSON":
             return ent.text
@@ -39,15 +42,16 @@ def extract_skills(text, skills_list):
 # Example skill set (can be expanded)
 skills_list = ["Python", "Machine Learning", "Deep Learning", "NLP", "Data Science", "SQL"]
 
-# Test the parser with a sample resume PDF
-pdf_path = "sample_resume.pdf"  # Replace with an actual file path
-resume_text = extract_text_from_pdf(pdf_path)
+if __name__ == "__main__":
+    # Test the parser with a sample resume PDF
+    pdf_path = "sample_resume.pdf"  # Replace with an actual file path
+    resume_text = extract_text_from_pdf(pdf_path)
 
-parsed_resume = {
-    "Name": extract_name(resume_text),
-    "Email": extract_email(resume_text),
-    "Phone": extract_phone(resume_text),
-    "Skills": extract_skills(resume_text, skills_list)
-}
+    parsed_resume = {
+        "Name": extract_name(resume_text),
+        "Email": extract_email(resume_text),
+        "Phone": extract_phone(resume_text),
+        "Skills": extract_skills(resume_text, skills_list)
+    }
 
-print(parsed_resume)
+    print(parsed_resume)